@@ -2,19 +2,259 @@
 Base Agent - Foundation for all specialist agents
 """
 
-from abc import ABC, abstractmethod
+import asyncio
+import contextlib
+import functools
+import hashlib
+import os
+import re
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar, Concatenate
 
-from pydantic import BaseModel
+import aiofiles
+import orjson
+from aiofiles.threadpool.text import AsyncTextIOWrapper
+from pydantic import BaseModel, ConfigDict
 
+from orchestrator.core.config import get_settings_snapshot
 from orchestrator.core.models import AgentRole, Deliverable, QualityGate, WorkspaceContext
 
+# Deliverables are tens to hundreds of KB; a large buffer keeps the number
+# of write()/read() syscalls per file low (the io default is 8 KiB)
+FILE_BUFFER_SIZE = 256 * 1024
+
+# Responses sampled above this temperature are meant to vary between
+# runs, so they are never cached
+LLM_CACHE_MAX_TEMPERATURE = 0.3
+
+# Responses kept in memory in front of the disk cache, so repeated prompts
+# within a run (retries, phase reruns) skip the file read
+LLM_MEMORY_CACHE_SIZE = 128
+
+# Output budget for one LLM call, and for one call that answers several
+# requests: four 16K-token answers fit the model's 64K output limit
+LLM_MAX_TOKENS = 16000
+LLM_BATCH_MAX_TOKENS = 64000
+
+# User prompts packed into one batched LLM call
+LLM_BATCH_SIZE = 4
+
+_BATCH_PROMPT_HEADER = """You will receive {count} independent requests, numbered 1 to {count}.
+Answer each one completely, exactly as if it were the only request.
+Start each answer with a line containing only "===== RESPONSE <number> =====",
+write nothing outside the answers, and end with a line containing only
+"===== END =====".
+"""
+
+_BATCH_RESPONSE_RE = re.compile(r"^===== RESPONSE (\d+) =====[ \t]*$", re.MULTILINE)
+_BATCH_END_RE = re.compile(r"^===== END =====[ \t]*$", re.MULTILINE)
+
+
+# In-memory LLM cache tier: prompt key -> (time stored, response), least
+# recently used first
+_llm_memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+
+# Deliverable timestamps have one-second resolution; reuse the datetime
+# built for the current second instead of calling datetime.now() per call
+_ts_cache: tuple[float, datetime] = (0.0, datetime.min)
+
+
+def _now() -> datetime:
+    """Get the current time, recomputed at most once per second"""
+    global _ts_cache
+
+    t = time.time()
+    cached_t, cached_dt = _ts_cache
+    # abs() so a backward clock step (e.g. NTP) refreshes too
+    if abs(t - cached_t) >= 1.0:
+        cached_dt = datetime.fromtimestamp(t)
+        _ts_cache = (t, cached_dt)
+    return cached_dt
+
+
+# Dedicated, bounded pool for all agent file I/O (including aiofiles
+# handles) so bursts of agents finishing together write in parallel
+# without crowding the default executor
+_io_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4), thread_name_prefix="tac9-io")
+
+
+async def _run_io(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking file operation on the I/O pool"""
+    return await asyncio.get_running_loop().run_in_executor(_io_pool, func, *args)
+
+
+def _write_bytes(path: str | Path, data: bytes) -> None:
+    """Write a whole file with a single write() in the common case"""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        fd = os.open(path, flags, 0o644)
+    except FileNotFoundError:
+        # Workspace phase directories already exist; only create
+        # parents for nested paths
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, flags, 0o644)
+
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _replace_bytes(path: str | Path, data: bytes) -> None:
+    """Write a whole file atomically, so readers never see a partial file"""
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    _write_bytes(tmp_path, data)
+    os.replace(tmp_path, path)
+
+
+def _save_bytes(path: str | Path, data: bytes) -> None:
+    """Write a deliverable atomically, skipping the write if it is unchanged"""
+    try:
+        if os.stat(path).st_size == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return
+    except FileNotFoundError:
+        pass
+    _replace_bytes(path, data)
+
+
+def _read_llm_cache(path: str, ttl_seconds: int) -> str | None:
+    """Return a cached LLM response, or None if missing or expired"""
+    try:
+        if time.time() - os.stat(path).st_mtime > ttl_seconds:
+            return None
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _write_llm_cache(path: str, response: str) -> None:
+    """Store an LLM response in the cache"""
+    # Concurrent runs may write the same key
+    _replace_bytes(path, response.encode("utf-8"))
+
+
+def _write_conversation(path: str, conversation: dict[str, Any]) -> None:
+    """Store one LLM exchange as indented JSON"""
+    _write_bytes(path, orjson.dumps(conversation, option=orjson.OPT_INDENT_2))
+
+
+def _remember_llm_response(key: str, response: str) -> None:
+    """Add a response to the in-memory LLM cache, evicting the least recently used"""
+    _llm_memory[key] = (time.time(), response)
+    _llm_memory.move_to_end(key)
+    if len(_llm_memory) > LLM_MEMORY_CACHE_SIZE:
+        _llm_memory.popitem(last=False)
+
+
+async def _store_llm_cache(key: str, path: str, response: str) -> None:
+    """Store a fresh LLM response in both cache tiers"""
+    _remember_llm_response(key, response)
+    await _run_io(_write_llm_cache, path, response)
+
+
+def split_batch_response(response: str, count: int) -> list[str] | None:
+    """
+    Split the output of a packed LLM call into its answers.
+
+    Args:
+        response: Response to a prompt built with _BATCH_PROMPT_HEADER
+        count: Number of packed requests
+
+    Returns:
+        One answer per request, or None if the response doesn't end with the
+        end line (e.g. it was truncated) or an answer is missing
+    """
+    # [body, rest after the end line]
+    ends = _BATCH_END_RE.split(response, maxsplit=1)
+    if len(ends) < 2:
+        return None
+
+    # [preamble, "1", answer, "2", answer, ...]
+    parts = _BATCH_RESPONSE_RE.split(ends[0])
+    if parts[1::2] != [str(i) for i in range(1, count + 1)]:
+        return None
+    return [answer.strip() for answer in parts[2::2]]
+
+
+# Speculatively started LLM requests, keyed by prompt fingerprint; the
+# first call with matching prompts takes the task over
+_prewarmed: dict[str, asyncio.Future[str]] = {}
+
+
+def cancel_prewarmed(tasks: Iterable[asyncio.Future[str]]) -> None:
+    """Cancel and forget speculative LLM requests that were never used"""
+    unused = set(tasks)
+    for key, task in list(_prewarmed.items()):
+        if task not in unused:
+            continue
+        del _prewarmed[key]
+        if task.done():
+            # Retrieve the outcome so a failed speculation isn't reported
+            # as an unhandled task exception
+            if not task.cancelled():
+                task.exception()
+        else:
+            task.cancel()
+
+
+@contextlib.asynccontextmanager
+async def pending_responses(keys: Iterable[str]) -> AsyncIterator[dict[str, asyncio.Future[str]]]:
+    """
+    Hand LLM responses supplied later to the calls made inside the block.
+
+    A call with matching prompts waits for its future instead of calling
+    the provider; whoever yields the futures resolves them. Futures no
+    call picked up are dropped on exit.
+
+    Args:
+        keys: Prompt keys (see BaseAgent._prompt_key)
+
+    Yields:
+        Unresolved response futures by prompt key
+    """
+    loop = asyncio.get_running_loop()
+    futures = {key: loop.create_future() for key in keys}
+    _prewarmed.update(futures)
+
+    try:
+        yield futures
+    finally:
+        cancel_prewarmed(futures.values())
+
+
+async def _open_for_write(path: str | Path) -> AsyncTextIOWrapper:
+    """Open a file for buffered async writing, creating parents if needed"""
+    try:
+        return await aiofiles.open(
+            path, "w", encoding="utf-8", buffering=FILE_BUFFER_SIZE, executor=_io_pool
+        )
+    except FileNotFoundError:
+        # Workspace phase directories already exist; only create
+        # parents for nested paths
+        await _run_io(functools.partial(os.makedirs, os.path.dirname(path), exist_ok=True))
+        return await aiofiles.open(
+            path, "w", encoding="utf-8", buffering=FILE_BUFFER_SIZE, executor=_io_pool
+        )
+
 
 class AgentInput(BaseModel):
     """Input data for an agent"""
 
+    # Immutable; hot paths build it with model_construct() from validated data
+    model_config = ConfigDict(frozen=True)
+
     workspace_context: WorkspaceContext
     previous_deliverables: list[Deliverable] = []
     metadata: dict[str, Any] = {}
@@ -23,6 +263,9 @@ class AgentInput(BaseModel):
 class AgentOutput(BaseModel):
     """Output data from an agent"""
 
+    # Immutable; hot paths build it with model_construct() from validated data
+    model_config = ConfigDict(frozen=True)
+
     deliverables: list[Deliverable] = []
     quality_gates: list[QualityGate] = []
     metadata: dict[str, Any] = {}
@@ -30,7 +273,7 @@ class AgentOutput(BaseModel):
     error: str | None = None
 
 
-class BaseAgent(ABC):
+class BaseAgent:
     """
     Base class for all specialist agents in TAC-9.
 
@@ -41,6 +284,14 @@ class BaseAgent(ABC):
     - Integrates with the Next.js + Supabase stack
     """
 
+    # Agents are created per task; slots keep instances small. Subclasses
+    # declare an empty __slots__ so they don't reintroduce a __dict__
+    __slots__ = ("role", "model", "temperature")
+
+    # LLM response cache statistics for this process
+    cache_hits: ClassVar[int] = 0
+    cache_misses: ClassVar[int] = 0
+
     def __init__(
         self,
         role: AgentRole,
@@ -51,10 +302,9 @@ class BaseAgent(ABC):
         self.model = model
         self.temperature = temperature
 
-    @abstractmethod
     async def execute(self, input_data: AgentInput) -> AgentOutput:
         """
-        Execute the agent's task.
+        Execute the agent's task (must be overridden).
 
         Args:
             input_data: Input containing workspace context and previous deliverables
@@ -62,12 +312,11 @@ class BaseAgent(ABC):
         Returns:
             AgentOutput with deliverables, quality gates, and metadata
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement execute()")
 
-    @abstractmethod
     def get_system_prompt(self, workspace_context: WorkspaceContext) -> str:
         """
-        Get the system prompt for this agent.
+        Get the system prompt for this agent (must be overridden).
 
         Args:
             workspace_context: Current workspace context
@@ -75,7 +324,7 @@ class BaseAgent(ABC):
         Returns:
             System prompt string with agent expertise and instructions
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement get_system_prompt()")
 
     def get_user_prompt(
         self, workspace_context: WorkspaceContext, previous_deliverables: list[Deliverable]
@@ -102,27 +351,315 @@ Target Project: {workspace_context.project_path}
 Please produce your deliverables according to your role and expertise.
 """
 
-    async def call_llm(self, system_prompt: str, user_prompt: str) -> str:
+    async def call_llm(
+        self, system_prompt: str, user_prompt: str, max_tokens: int = LLM_MAX_TOKENS
+    ) -> str:
         """
         Call the LLM with the given prompts.
 
         Args:
             system_prompt: System prompt
             user_prompt: User prompt
+            max_tokens: Maximum tokens to generate
 
         Returns:
             LLM response text
         """
+        key = self._prompt_key(system_prompt, user_prompt)
+        prewarmed = _prewarmed.pop(key, None)
+        if prewarmed is not None:
+            return await prewarmed
+
+        return await self._fetch_llm(key, system_prompt, user_prompt, max_tokens)
+
+    async def _fetch_llm(
+        self,
+        key: str,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = LLM_MAX_TOKENS,
+        *,
+        cacheable: Callable[[str], bool] | None = None,
+    ) -> str:
+        """Get an LLM response from the cache or the provider, caching it unless rejected"""
+        cache_path, cached = await self._lookup_llm_cache(key)
+        if cached is not None:
+            return cached
+
+        # Import here to avoid circular dependency
+        from orchestrator.services.llm_service import llm_service
+
+        response = await llm_service.call(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            model=self.model,
+            temperature=self.temperature,
+            max_tokens=max_tokens,
+        )
+
+        if cache_path is not None and (cacheable is None or cacheable(response)):
+            await _store_llm_cache(key, cache_path, response)
+        await self._log_conversation(key, system_prompt, user_prompt, response)
+
+        return response
+
+    async def call_llm_batch(self, system_prompt: str, user_prompts: list[str]) -> list[str] | None:
+        """
+        Answer several user prompts that share a system prompt with one LLM call.
+
+        The packed response is not cached, so one that can't be split is
+        never replayed.
+
+        Args:
+            system_prompt: System prompt
+            user_prompts: User prompts to pack into the request
+
+        Returns:
+            One response per user prompt, or None if the output couldn't be split
+        """
         # Import here to avoid circular dependency
         from orchestrator.services.llm_service import llm_service
 
-        return await llm_service.call(
+        packed = _BATCH_PROMPT_HEADER.format(count=len(user_prompts)) + "".join(
+            f"\n===== REQUEST {i} =====\n{prompt}\n" for i, prompt in enumerate(user_prompts, 1)
+        )
+        response = await llm_service.call(
+            system_prompt=system_prompt,
+            user_prompt=packed,
+            model=self.model,
+            temperature=self.temperature,
+            max_tokens=LLM_BATCH_MAX_TOKENS,
+        )
+        return split_batch_response(response, len(user_prompts))
+
+    def prewarm(self, input_data: AgentInput) -> asyncio.Future[str]:
+        """
+        Start this agent's LLM request ahead of its turn.
+
+        The response is handed to the first call_llm/call_llm_stream with the
+        same prompts; if the prompts turn out different it is never used.
+
+        Args:
+            input_data: Input the agent is expected to run with
+
+        Returns:
+            Future resolving to the LLM response text (a task, or a pending
+            batched response)
+        """
+        workspace = input_data.workspace_context
+        system_prompt = self.get_system_prompt(workspace)
+        user_prompt = self.get_user_prompt(workspace, input_data.previous_deliverables)
+
+        key = self._prompt_key(system_prompt, user_prompt)
+        task = _prewarmed.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_llm(key, system_prompt, user_prompt))
+            _prewarmed[key] = task
+        return task
+
+    async def call_llm_stream(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        """
+        Call the LLM with the given prompts, yielding text as it arrives.
+
+        Args:
+            system_prompt: System prompt
+            user_prompt: User prompt
+
+        Yields:
+            Chunks of LLM response text
+        """
+        key = self._prompt_key(system_prompt, user_prompt)
+        prewarmed = _prewarmed.pop(key, None)
+        if prewarmed is not None:
+            yield await prewarmed
+            return
+
+        cache_path, cached = await self._lookup_llm_cache(key)
+        if cached is not None:
+            yield cached
+            return
+
+        # Import here to avoid circular dependency
+        from orchestrator.services.llm_service import llm_service
+
+        parts: list[str] = []
+        async for chunk in llm_service.call_stream(
             system_prompt=system_prompt,
             user_prompt=user_prompt,
             model=self.model,
             temperature=self.temperature,
+        ):
+            parts.append(chunk)
+            yield chunk
+
+        response = "".join(parts)
+        if cache_path is not None:
+            await _store_llm_cache(key, cache_path, response)
+        await self._log_conversation(key, system_prompt, user_prompt, response)
+
+    async def call_llm_to_file(self, system_prompt: str, user_prompt: str, path: str | Path) -> str:
+        """
+        Call the LLM and write its response to a file.
+
+        With streaming enabled, chunks are written as they arrive so file
+        I/O overlaps generation instead of following it. They go to a
+        temporary file that replaces the target only once the response is
+        complete, so a failed or cancelled attempt never leaves a truncated
+        deliverable behind.
+
+        Args:
+            system_prompt: System prompt
+            user_prompt: User prompt
+            path: File to write the response to
+
+        Returns:
+            LLM response text
+        """
+        if not get_settings_snapshot().enable_streaming:
+            content = await self.call_llm(system_prompt, user_prompt)
+            await self.save_file(path, content)
+            return content
+
+        parts: list[str] = []
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            f = await _open_for_write(tmp_path)
+            try:
+                async for chunk in self.call_llm_stream(system_prompt, user_prompt):
+                    parts.append(chunk)
+                    await f.write(chunk)
+            finally:
+                await f.close()
+            await _run_io(os.replace, tmp_path, path)
+        finally:
+            # Only left over if the response didn't complete
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp_path)
+        return "".join(parts)
+
+    async def _lookup_llm_cache(self, key: str) -> tuple[str | None, str | None]:
+        """
+        Look up a cached LLM response.
+
+        Args:
+            key: Prompt key from _prompt_key()
+
+        Returns:
+            Tuple of (cache file to store a fresh response in, cached response);
+            the path is None when this agent's calls aren't cached
+        """
+        settings = get_settings_snapshot()
+        if not settings.enable_llm_cache or self.temperature > LLM_CACHE_MAX_TEMPERATURE:
+            return None, None
+
+        # Shard by key prefix to keep directories small
+        cache_path = os.path.join(settings.cache_dir, "llm", key[:2], key)
+
+        entry = _llm_memory.get(key)
+        if entry is not None and time.time() - entry[0] <= settings.llm_cache_ttl_seconds:
+            _llm_memory.move_to_end(key)
+            BaseAgent.cache_hits += 1
+            return cache_path, entry[1]
+
+        cached = await _run_io(_read_llm_cache, cache_path, settings.llm_cache_ttl_seconds)
+        if cached is None:
+            BaseAgent.cache_misses += 1
+        else:
+            BaseAgent.cache_hits += 1
+            _remember_llm_response(key, cached)
+        return cache_path, cached
+
+    async def _log_conversation(
+        self, key: str, system_prompt: str, user_prompt: str, response: str
+    ) -> None:
+        """Save an LLM exchange to the conversation log, if enabled"""
+        settings = get_settings_snapshot()
+        if not settings.save_agent_conversations:
+            return
+
+        timestamp = _now()
+        path = os.path.join(
+            settings.conversation_dir,
+            f"{timestamp:%Y%m%d-%H%M%S}-{self.role.value}-{key[:8]}.json",
+        )
+        conversation = {
+            "agent": self.role.value,
+            "model": self.model,
+            "temperature": self.temperature,
+            "timestamp": timestamp,
+            "system_prompt": system_prompt,
+            "user_prompt": user_prompt,
+            "response": response,
+        }
+        await _run_io(_write_conversation, path, conversation)
+
+    def _prompt_key(self, system_prompt: str, user_prompt: str) -> str:
+        """Get the cache/prewarm key for a prompt pair"""
+        digest = hashlib.blake2b(digest_size=16)
+        parts = (self.role.value, self.model, str(self.temperature), system_prompt, user_prompt)
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    async def execute_batch(self, inputs: list[AgentInput]) -> list[AgentOutput]:
+        """
+        Execute the agent for several inputs (can be overridden).
+
+        Args:
+            inputs: Inputs to execute, typically one per feature
+
+        Returns:
+            One AgentOutput per input, in order
+        """
+        return list(await asyncio.gather(*map(self.execute, inputs)))
+
+    @contextlib.asynccontextmanager
+    async def batched_llm(self, inputs: list[AgentInput]) -> AsyncIterator[None]:
+        """
+        Answer the LLM requests of several inputs with packed calls.
+
+        Inputs sharing a system prompt are sent LLM_BATCH_SIZE at a time in
+        one request, and each answer is handed to the matching
+        call_llm/call_llm_stream made inside the block. Requests that can't
+        be packed or whose output can't be split fall back to single calls.
+
+        Args:
+            inputs: Inputs that will be executed inside the block
+        """
+        # Unique user prompts per system prompt, in input order
+        groups: dict[str, dict[str, None]] = {}
+        for input_data in inputs:
+            workspace = input_data.workspace_context
+            system_prompt = self.get_system_prompt(workspace)
+            user_prompt = self.get_user_prompt(workspace, input_data.previous_deliverables)
+            groups.setdefault(system_prompt, {})[user_prompt] = None
+
+        batches: list[tuple[str, list[str]]] = []
+        for system_prompt, unique_prompts in groups.items():
+            user_prompts = list(unique_prompts)
+            for i in range(0, len(user_prompts), LLM_BATCH_SIZE):
+                chunk = user_prompts[i : i + LLM_BATCH_SIZE]
+                if len(chunk) > 1:
+                    batches.append((system_prompt, chunk))
+
+        results = await asyncio.gather(
+            *(self.call_llm_batch(system_prompt, chunk) for system_prompt, chunk in batches),
+            return_exceptions=True,
         )
 
+        responses: dict[str, str] = {}
+        for (system_prompt, chunk), answers in zip(batches, results, strict=True):
+            if answers is None or isinstance(answers, BaseException):
+                continue
+            for user_prompt, answer in zip(chunk, answers, strict=True):
+                responses[self._prompt_key(system_prompt, user_prompt)] = answer
+
+        async with pending_responses(responses) as futures:
+            for key, future in futures.items():
+                future.set_result(responses[key])
+            yield
+
     def create_deliverable(
         self,
         name: str,
@@ -139,7 +676,7 @@ Please produce your deliverables according to your role and expertise.
             content=content,
             metadata=metadata or {},
             created_by=self.role,
-            created_at=datetime.now(),
+            created_at=_now(),
         )
 
     def create_quality_gate(
@@ -157,11 +694,60 @@ Please produce your deliverables according to your role and expertise.
             details=details or {},
         )
 
-    def save_file(self, path: Path, content: str) -> None:
-        """Save content to a file"""
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
+    async def save_file(self, path: str | Path, content: str) -> None:
+        """Save content to a file without blocking the event loop"""
+        await _run_io(_save_bytes, path, content.encode("utf-8"))
+
+    async def read_file(self, path: Path) -> str:
+        """Read content from a file without blocking the event loop"""
+        async with aiofiles.open(
+            path, encoding="utf-8", buffering=FILE_BUFFER_SIZE, executor=_io_pool
+        ) as f:
+            content: str = await f.read()
+        return content
+
+
+def make_execute(
+    subpath: str,
+    name: str,
+    deliverable_type: str,
+    metadata: dict[str, Any] | None = None,
+) -> Callable[Concatenate[BaseAgent, ...], Coroutine[Any, Any, AgentOutput]]:
+    """
+    Build an execute() for agents that generate a single deliverable.
+
+    Output location and deliverable details are bound in the closure, so
+    each call only joins a precreated workspace directory with a file name.
+
+    Args:
+        subpath: Output path within the workspace, in one of the workspace
+            subdirectories (e.g. "02-architecture/system-design.md")
+        name: Deliverable name
+        deliverable_type: Deliverable type ("document" or "file")
+        metadata: Extra deliverable metadata
+
+    Returns:
+        Async execute method to assign on the agent class
+    """
+    subdir, filename = os.path.split(subpath)
+
+    async def execute(self: BaseAgent, input_data: AgentInput) -> AgentOutput:
+        workspace = input_data.workspace_context
+        system_prompt = self.get_system_prompt(workspace)
+        user_prompt = self.get_user_prompt(workspace, input_data.previous_deliverables)
+
+        # Plain string join; only the deliverable needs a Path object
+        path = os.path.join(workspace.subdirs[subdir], filename)
+        content = await self.call_llm_to_file(system_prompt, user_prompt, path)
+
+        deliverable = self.create_deliverable(
+            name=name,
+            deliverable_type=deliverable_type,
+            path=Path(path),
+            content=content,
+            metadata=metadata,
+        )
+
+        return AgentOutput.model_construct(deliverables=[deliverable], success=True)
 
-    def read_file(self, path: Path) -> str:
-        """Read content from a file"""
-        return path.read_text(encoding="utf-8")
+    return execute
@@ -0,0 +1,203 @@
+"""
+Batch Review Agent
+
+Produces the code review, performance audit, and security audit with a
+single LLM call.
+"""
+
+import asyncio
+import contextlib
+import logging
+import re
+from collections.abc import AsyncIterator, Iterable
+
+from agents.base import (
+    LLM_BATCH_MAX_TOKENS,
+    AgentInput,
+    AgentOutput,
+    BaseAgent,
+    pending_responses,
+)
+from orchestrator.core.models import AgentRole, WorkspaceContext
+from orchestrator.services.agent_registry import agent_registry
+
+# Report sections, in the order the model is asked to write them
+_SECTIONS: dict[str, AgentRole] = {
+    "CODE_REVIEW": AgentRole.CODE_REVIEWER,
+    "PERFORMANCE_AUDIT": AgentRole.PERFORMANCE_ENGINEER,
+    "SECURITY_AUDIT": AgentRole.SECURITY_ENGINEER,
+}
+
+# Heading the model writes after the last report; a response cut off by
+# the token limit never reaches it
+_END = "END"
+
+_SECTION_RE = re.compile(r"^### (" + "|".join([*_SECTIONS, _END]) + r")[ \t]*$", re.MULTILINE)
+
+logger = logging.getLogger(__name__)
+
+
+class BatchReviewAgent(BaseAgent):
+    """Batch Reviewer - Runs all review agents from one LLM call"""
+
+    __slots__ = ("reviewers",)
+
+    # Agents whose reports this agent can produce
+    ROLES = frozenset(_SECTIONS.values())
+
+    def __init__(self, roles: Iterable[AgentRole] | None = None):
+        super().__init__(role=AgentRole.CODE_REVIEWER, model="claude-sonnet-4.5", temperature=0.1)
+        roles = self.ROLES if roles is None else set(roles)
+        self.reviewers: dict[str, BaseAgent] = {
+            section: agent_registry.get_agent(role)
+            for section, role in _SECTIONS.items()
+            if role in roles
+        }
+
+    async def execute(self, input_data: AgentInput) -> AgentOutput:
+        async with self.batched(input_data):
+            outputs = await asyncio.gather(
+                *(reviewer.execute(input_data) for reviewer in self.reviewers.values())
+            )
+
+        return AgentOutput.model_construct(
+            deliverables=[d for output in outputs for d in output.deliverables],
+            quality_gates=[g for output in outputs for g in output.quality_gates],
+            success=all(output.success for output in outputs),
+        )
+
+    @contextlib.asynccontextmanager
+    async def batched(
+        self, input_data: AgentInput, timeout: float | None = None
+    ) -> AsyncIterator[None]:
+        """
+        Answer the review agents' LLM requests with one batched call.
+
+        The call runs in the background while the block executes: review
+        agents executed inside it wait for their section of the response
+        and write their own report and quality gates, anything else runs
+        without waiting. If the call fails, times out, is cut off, or a
+        section is missing, the review agents' own requests are made instead.
+
+        Args:
+            input_data: Input the review agents will be executed with
+            timeout: Seconds to wait for the batched call (None for no limit)
+        """
+        workspace = input_data.workspace_context
+        previous = input_data.previous_deliverables
+
+        # (prompt key, system prompt, user prompt) of each review agent
+        requests: dict[str, tuple[str, str, str]] = {}
+        for section, reviewer in self.reviewers.items():
+            system_prompt = reviewer.get_system_prompt(workspace)
+            user_prompt = reviewer.get_user_prompt(workspace, previous)
+            key = reviewer._prompt_key(system_prompt, user_prompt)
+            requests[section] = (key, system_prompt, user_prompt)
+
+        async with pending_responses(key for key, _, _ in requests.values()) as futures:
+            batch = asyncio.create_task(self._answer(input_data, requests, futures, timeout))
+            try:
+                yield
+            finally:
+                # Every review agent is done with it
+                batch.cancel()
+
+    async def _answer(
+        self,
+        input_data: AgentInput,
+        requests: dict[str, tuple[str, str, str]],
+        futures: dict[str, asyncio.Future[str]],
+        timeout: float | None,
+    ) -> None:
+        """Resolve the review agents' pending requests from one batched call"""
+        workspace = input_data.workspace_context
+        system_prompt = self.get_system_prompt(workspace)
+        user_prompt = self.get_user_prompt(workspace, input_data.previous_deliverables)
+        try:
+            # Only a response that splits into every report is cached, so a
+            # truncated one isn't replayed on the next run
+            response = await asyncio.wait_for(
+                self._fetch_llm(
+                    self._prompt_key(system_prompt, user_prompt),
+                    system_prompt,
+                    user_prompt,
+                    LLM_BATCH_MAX_TOKENS,
+                    cacheable=lambda response: self._split_sections(response) is not None,
+                ),
+                timeout=timeout,
+            )
+        except Exception:
+            logger.warning("Batched review call failed; reviewing separately", exc_info=True)
+            response = ""
+
+        sections = self._split_sections(response)
+        if sections is not None:
+            for section, (key, _, _) in requests.items():
+                _resolve(futures[key], sections[section])
+            return
+
+        await asyncio.gather(
+            *(
+                self._review_separately(section, *request, futures[request[0]])
+                for section, request in requests.items()
+            )
+        )
+
+    async def _review_separately(
+        self,
+        section: str,
+        key: str,
+        system_prompt: str,
+        user_prompt: str,
+        future: asyncio.Future[str],
+    ) -> None:
+        """Resolve a review agent's pending request with its own LLM call"""
+        if future.done():
+            return
+
+        try:
+            response = await self.reviewers[section]._fetch_llm(key, system_prompt, user_prompt)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            _resolve(future, response)
+
+    def _split_sections(self, response: str) -> dict[str, str] | None:
+        """
+        Split a batched response into its sections.
+
+        Returns:
+            Section bodies by name, or None if the response doesn't end with
+            the end heading (e.g. it was truncated) or a section is missing
+        """
+        # [preamble, "CODE_REVIEW", body, ..., "SECURITY_AUDIT", body, "END", rest]
+        parts = _SECTION_RE.split(response)
+        if len(parts) < 3 or parts[-2] != _END:
+            return None
+        sections = {
+            name: body.strip() for name, body in zip(parts[1:-2:2], parts[2:-2:2], strict=True)
+        }
+        if not all(sections.get(section) for section in self.reviewers):
+            return None
+        return sections
+
+    def get_system_prompt(self, workspace_context: WorkspaceContext) -> str:
+        headings = ", ".join(f"### {section}" for section in self.reviewers)
+        briefs = "\n\n".join(
+            f"{section}:\n{reviewer.get_system_prompt(workspace_context)}"
+            for section, reviewer in self.reviewers.items()
+        )
+        return f"""You are a review panel producing {len(self.reviewers)} independent reports.
+
+Write each report under its own heading line, exactly as shown and in this
+order: {headings}. Write nothing before the first heading, and end with a
+line containing only ### {_END}.
+
+{briefs}"""
+
+
+def _resolve(future: asyncio.Future[str], response: str) -> None:
+    """Hand a response to a pending request, unless its agent stopped waiting"""
+    if not future.done():
+        future.set_result(response)
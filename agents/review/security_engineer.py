@@ -4,52 +4,124 @@ Security Engineer Agent
 Performs security audit and vulnerability scanning.
 """
 
+import os
+import re
+from collections import Counter
+from pathlib import Path
+
 from agents.base import AgentInput, AgentOutput, BaseAgent
-from orchestrator.core.models import AgentRole, WorkspaceContext
+from orchestrator.core.models import AgentRole, QualityGate, WorkspaceContext
+
+# Severity ratings, most severe first; findings at the first two fail the gate
+SEVERITIES = ("critical", "high", "medium", "low", "info")
+BLOCKING_SEVERITIES = frozenset({"critical", "high"})
+
+# Ratings in one pass: "Critical:"/"High: 2" labels in any case (with an
+# optional count, as in summary tables, where "None", "N/A" or "-" mean
+# zero), uppercase ratings where a rating goes (a table cell, heading,
+# brackets, or after a dash), and "Severity: High" in any case
+_LEVELS = "|".join(SEVERITIES)
+_RATING_OPEN = r"(?:^[ \t]*(?:#{1,6}[ \t]+)?|[|\[(]|[ \t][-–—][ \t])[ \t*_]*"
+_RATING_CLOSE = r"[*_]*(?=[ \t]*(?:$|[|\])]|:|[ \t][-–—][ \t]))"
+_SEVERITY_RE = re.compile(
+    rf"(?i:\b(?P<label>{_LEVELS})\s*:)[ \t*_]*"
+    rf"(?:(?P<count>\d+)\b|(?P<none>(?i:none|n/?a)\b|-(?=[ \t]*(?:$|\|))))?"
+    rf"|{_RATING_OPEN}\b(?P<rating>{_LEVELS.upper()})\b{_RATING_CLOSE}"
+    rf"|(?i:\bseverity\b\W{{0,4}}(?P<severity>{_LEVELS})\b)",
+    re.MULTILINE,
+)
+
+
+def count_severities(audit: str) -> dict[str, int]:
+    """
+    Count the findings in an audit report by severity.
+
+    A label with a count ("High: 2", "Critical: None") states the number
+    of findings rather than being one; each other rating counts as a
+    finding. The larger of the two is used, so a summary table doesn't
+    double count the findings it sums up, and a "0" doesn't hide a finding
+    listed below.
+    """
+    stated: Counter[str] = Counter()
+    rated: Counter[str] = Counter()
+    for m in _SEVERITY_RE.finditer(audit):
+        severity = (m["label"] or m["rating"] or m["severity"]).lower()
+        if m["count"] is not None:
+            stated[severity] += int(m["count"])
+        elif m["none"] is None:
+            rated[severity] += 1
+    return {severity: max(stated[severity], rated[severity]) for severity in SEVERITIES}
+
+
+# Gate for audits without any rated findings, validated once; each audit
+# gets its own copy so callers can't change another audit's result
+_CLEAN_GATE = QualityGate(
+    name="Security Audit",
+    passed=True,
+    message="No critical vulnerabilities found",
+    details={"severity_counts": dict.fromkeys(SEVERITIES, 0)},
+)
 
 
 class SecurityEngineerAgent(BaseAgent):
     """Security Engineer - Performs security audits"""
 
+    __slots__ = ()
+
+    _SYSTEM_PROMPT = """You are a Security Engineer specializing in web application security.
+
+Audit for:
+- SQL injection vulnerabilities
+- XSS vulnerabilities
+- CSRF protection
+- RLS policy bypasses
+- Input validation gaps
+- Secrets exposure
+- Authentication/authorization flaws
+
+Generate security audit report with severity ratings."""
+
     def __init__(self):
-        super().__init__(role=AgentRole.SECURITY_ENGINEER, model="claude-sonnet-4.5", temperature=0.1)
+        super().__init__(
+            role=AgentRole.SECURITY_ENGINEER, model="claude-sonnet-4.5", temperature=0.1
+        )
 
     async def execute(self, input_data: AgentInput) -> AgentOutput:
         workspace = input_data.workspace_context
         system_prompt = self.get_system_prompt(workspace)
         user_prompt = self.get_user_prompt(workspace, input_data.previous_deliverables)
 
-        security_audit = await self.call_llm(system_prompt, user_prompt)
-        audit_path = workspace.workspace_path / "07-reviews" / "security-audit.md"
-        self.save_file(audit_path, security_audit)
+        # Plain string join; only the deliverable needs a Path object
+        audit_path = os.path.join(workspace.subdirs["07-reviews"], "security-audit.md")
+        security_audit = await self.call_llm_to_file(system_prompt, user_prompt, audit_path)
 
         deliverable = self.create_deliverable(
             name="Security Audit Report",
             deliverable_type="document",
-            path=audit_path,
+            path=Path(audit_path),
             content=security_audit,
         )
 
         # Check for critical vulnerabilities
-        has_vulnerabilities = "CRITICAL" in security_audit or "HIGH" in security_audit
-        quality_gate = self.create_quality_gate(
-            name="Security Audit",
-            passed=not has_vulnerabilities,
-            message="No critical vulnerabilities found" if not has_vulnerabilities else "Critical vulnerabilities detected",
-        )
+        severity_counts = count_severities(security_audit)
+        if not any(severity_counts.values()):
+            quality_gate = _CLEAN_GATE.model_copy(deep=True)
+        else:
+            has_vulnerabilities = any(severity_counts[s] for s in BLOCKING_SEVERITIES)
+            quality_gate = self.create_quality_gate(
+                name="Security Audit",
+                passed=not has_vulnerabilities,
+                message=(
+                    "No critical vulnerabilities found"
+                    if not has_vulnerabilities
+                    else "Critical vulnerabilities detected"
+                ),
+                details={"severity_counts": severity_counts},
+            )
 
-        return AgentOutput(deliverables=[deliverable], quality_gates=[quality_gate], success=True)
+        return AgentOutput.model_construct(
+            deliverables=[deliverable], quality_gates=[quality_gate], success=True
+        )
 
     def get_system_prompt(self, workspace_context: WorkspaceContext) -> str:
-        return """You are a Security Engineer specializing in web application security.
-
-Audit for:
-- SQL injection vulnerabilities
-- XSS vulnerabilities
-- CSRF protection
-- RLS policy bypasses
-- Input validation gaps
-- Secrets exposure
-- Authentication/authorization flaws
-
-Generate security audit report with severity ratings."""
+        return self._SYSTEM_PROMPT
@@ -5,27 +5,40 @@ Interactive CLI for the Agentic SDLC Orchestrator
 """
 
 import asyncio
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
 
-from orchestrator.core.config import settings
-from orchestrator.core.models import FeatureRequest, WorkflowMode
-from orchestrator.core.orchestrator import SDLCOrchestrator
+from orchestrator.core.console import console
+
+# The orchestrator, agents, and provider SDKs are imported inside the
+# commands that run them, so --help, list-agents, and config start quickly
+if TYPE_CHECKING:
+    from orchestrator.core.models import FeatureRequest, WorkflowMode
 
 app = typer.Typer(
     name="tac9",
     help="TAC-9: Agentic SDLC Orchestrator - From Idea to Production in Minutes",
     add_completion=False,
 )
-console = Console()
+
+# Agents listed by `tac9 list-agents`, grouped by phase
+_PHASES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Product Definition", ("product-manager", "ux-researcher", "business-analyst")),
+    ("Architecture & Design", ("solutions-architect", "database-architect", "security-architect")),
+    ("Implementation", ("database-engineer", "backend-engineer", "frontend-engineer")),
+    ("Testing", ("qa-engineer", "e2e-test-engineer", "db-test-engineer")),
+    ("Security & Review", ("security-engineer", "code-reviewer", "performance-engineer")),
+    ("Documentation & Deployment", ("technical-writer", "devops-engineer")),
+)
 
 
 def print_banner():
     """Print TAC-9 banner"""
+    from rich.panel import Panel
+
     banner = """
 ╭─────────────────────────────────────────────────────╮
 │                                                     │
@@ -42,6 +55,11 @@ def interactive():
     """
     Start interactive mode - walk through feature creation step by step
     """
+    from rich.prompt import Confirm, Prompt
+
+    from orchestrator.core.config import get_settings
+    from orchestrator.core.models import FeatureRequest, WorkflowMode
+
     print_banner()
 
     console.print("\n[bold]Welcome to TAC-9 Interactive Mode![/bold]\n")
@@ -93,6 +111,7 @@ def interactive():
     )
 
     # Confirm and run
+    settings = get_settings()
     console.print("\n[bold cyan]Step 3:[/bold cyan] Review and confirm\n")
     console.print(f"  Feature: {description}")
     console.print(f"  Mode: {mode.value}")
@@ -115,6 +134,8 @@ def full(
     """
     Run full SDLC workflow (all phases)
     """
+    from orchestrator.core.models import FeatureRequest, WorkflowMode
+
     print_banner()
 
     request = FeatureRequest(
@@ -132,6 +153,8 @@ def from_prd(
     """
     Start from existing PRD (skip product phase)
     """
+    from orchestrator.core.models import FeatureRequest, WorkflowMode
+
     print_banner()
 
     if not prd.exists():
@@ -158,6 +181,8 @@ def agent(
     """
     Run a specific agent only
     """
+    from orchestrator.core.models import FeatureRequest, WorkflowMode
+
     print_banner()
 
     request = FeatureRequest(
@@ -187,42 +212,10 @@ def list_agents():
 
     console.print("\n[bold]Available Specialist Agents:[/bold]\n")
 
-    phases = {
-        "Product Definition": [
-            "product-manager",
-            "ux-researcher",
-            "business-analyst",
-        ],
-        "Architecture & Design": [
-            "solutions-architect",
-            "database-architect",
-            "security-architect",
-        ],
-        "Implementation": [
-            "database-engineer",
-            "backend-engineer",
-            "frontend-engineer",
-        ],
-        "Testing": [
-            "qa-engineer",
-            "e2e-test-engineer",
-            "db-test-engineer",
-        ],
-        "Security & Review": [
-            "security-engineer",
-            "code-reviewer",
-            "performance-engineer",
-        ],
-        "Documentation & Deployment": [
-            "technical-writer",
-            "devops-engineer",
-        ],
-    }
-
-    for phase, agents in phases.items():
+    for phase, agent_names in _PHASES:
         console.print(f"[bold cyan]{phase}:[/bold cyan]")
-        for agent in agents:
-            console.print(f"  • {agent}")
+        for agent_name in agent_names:
+            console.print(f"  • {agent_name}")
         console.print()
 
 
@@ -231,8 +224,11 @@ def config():
     """
     Show current configuration
     """
+    from orchestrator.core.config import get_settings
+
     print_banner()
 
+    settings = get_settings()
     console.print("\n[bold]Current Configuration:[/bold]\n")
 
     console.print("[bold cyan]AI Provider:[/bold cyan]")
@@ -258,17 +254,40 @@ def config():
     console.print(f"  Agent Timeout: {settings.agent_timeout_seconds}s")
     console.print(f"  Workspace Dir: {settings.workspace_dir}")
 
+    console.print("\n[bold cyan]LLM Cache:[/bold cyan]")
+    console.print(f"  Enabled: {'✓' if settings.enable_llm_cache else '✗'}")
+    console.print(f"  TTL: {settings.llm_cache_ttl_seconds}s")
+    cached = sum(len(files) for _, _, files in os.walk(settings.cache_dir / "llm"))
+    console.print(f"  Cached Responses: {cached}")
+
     console.print("\n[bold cyan]Automation:[/bold cyan]")
     console.print(f"  Auto Commit: {'✓' if settings.enable_auto_commit else '✗'}")
     console.print(f"  Auto PR: {'✓' if settings.enable_auto_pr else '✗'}")
     console.print(f"  Auto Test: {'✓' if settings.enable_auto_test else '✗'}")
 
 
-async def run_orchestrator(request: FeatureRequest, mode: WorkflowMode):
+async def run_orchestrator(request: "FeatureRequest", mode: "WorkflowMode"):
     """Run the orchestrator"""
+    from rich.prompt import Confirm
+
+    from orchestrator.core.config import get_settings
+    from orchestrator.core.orchestrator import SDLCOrchestrator
+    from orchestrator.services.agent_registry import agent_registry
+
+    settings = get_settings()
+    settings.ensure_dirs()
     orchestrator = SDLCOrchestrator()
+    warm_up: asyncio.Future[tuple[object, object]] | None = None
 
     try:
+        from orchestrator.services.llm_service import llm_service
+
+        # Connect to the providers and import the agents while the workspace
+        # is being set up; an agent that fails to import raises when it runs
+        warm_up = asyncio.gather(
+            llm_service.warm_up(), agent_registry.preload_all(), return_exceptions=True
+        )
+
         execution = await orchestrator.execute_feature_request(request, mode)
 
         # Print final workspace location
@@ -284,6 +303,10 @@ async def run_orchestrator(request: FeatureRequest, mode: WorkflowMode):
     except Exception as e:
         console.print(f"\n[bold red]Error:[/bold red] {e}")
         raise typer.Exit(1)
+    finally:
+        if warm_up is not None:
+            await warm_up
+            await llm_service.aclose()
 
 
 if __name__ == "__main__":
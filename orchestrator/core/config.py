@@ -2,6 +2,10 @@
 Configuration management for TAC-9 Orchestrator
 """
 
+import dataclasses
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Literal
 
@@ -9,7 +13,40 @@ from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
-class Settings(BaseSettings):
+class _ConfiguredServices:
+    """Checks for configured integrations, shared by Settings and its snapshot"""
+
+    __slots__ = ()
+
+    openai_api_key: str | None
+    anthropic_api_key: str | None
+    github_token: str | None
+    github_repo: str | None
+    supabase_anon_key: str | None
+    supabase_service_role_key: str | None
+
+    @property
+    def has_openai(self) -> bool:
+        """Check if OpenAI is configured"""
+        return self.openai_api_key is not None
+
+    @property
+    def has_anthropic(self) -> bool:
+        """Check if Anthropic is configured"""
+        return self.anthropic_api_key is not None
+
+    @property
+    def has_github(self) -> bool:
+        """Check if GitHub is configured"""
+        return self.github_token is not None and self.github_repo is not None
+
+    @property
+    def has_supabase(self) -> bool:
+        """Check if Supabase is configured"""
+        return self.supabase_anon_key is not None and self.supabase_service_role_key is not None
+
+
+class Settings(_ConfiguredServices, BaseSettings):
     """TAC-9 Orchestrator Settings"""
 
     model_config = SettingsConfigDict(
@@ -64,11 +101,15 @@ class Settings(BaseSettings):
 
     # Specific Agents
     enable_product_manager: bool = True
+    enable_ux_researcher: bool = True
+    enable_business_analyst: bool = True
     enable_solutions_architect: bool = True
     enable_database_architect: bool = True
+    enable_security_architect: bool = True
     enable_database_engineer: bool = True
     enable_backend_engineer: bool = True
     enable_frontend_engineer: bool = True
+    enable_qa_engineer: bool = True
     enable_e2e_test_engineer: bool = True
     enable_db_test_engineer: bool = True
     enable_security_engineer: bool = True
@@ -97,36 +138,137 @@ class Settings(BaseSettings):
     agent_max_retries: int = 2
     template_dir: Path = Field(default=Path("./templates"))
     enable_streaming: bool = True
+    enable_llm_cache: bool = True
+    llm_cache_ttl_seconds: int = 86400
+    llm_max_concurrent_requests: int = 8
+    llm_max_retries: int = 2
+    enable_speculative_prewarm: bool = False
+    enable_review_batching: bool = True
     save_agent_conversations: bool = True
     conversation_dir: Path = Field(default=Path("./logs/conversations"))
 
-    def model_post_init(self, __context):
-        """Ensure directories exist"""
-        self.workspace_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.conversation_dir.mkdir(parents=True, exist_ok=True)
-        self.template_dir.mkdir(parents=True, exist_ok=True)
+    def ensure_dirs(self) -> None:
+        """Create the working directories (only needed before a run)"""
+        dirs = (self.workspace_dir, self.cache_dir, self.conversation_dir, self.template_dir)
+        # The mkdir syscalls block on the disk; issue them concurrently
+        with ThreadPoolExecutor(max_workers=len(dirs)) as pool:
+            list(pool.map(functools.partial(os.makedirs, exist_ok=True), dirs))
 
-    @property
-    def has_openai(self) -> bool:
-        """Check if OpenAI is configured"""
-        return self.openai_api_key is not None
 
-    @property
-    def has_anthropic(self) -> bool:
-        """Check if Anthropic is configured"""
-        return self.anthropic_api_key is not None
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the settings, parsed from the environment on first use"""
+    return Settings()
 
-    @property
-    def has_github(self) -> bool:
-        """Check if GitHub is configured"""
-        return self.github_token is not None and self.github_repo is not None
 
-    @property
-    def has_supabase(self) -> bool:
-        """Check if Supabase is configured"""
-        return self.supabase_anon_key is not None and self.supabase_service_role_key is not None
+@dataclasses.dataclass(frozen=True, slots=True)
+class SettingsSnapshot(_ConfiguredServices):
+    """
+    Frozen, slotted copy of the settings fields for code that reads settings
+    per task or per LLM call: attribute reads are plain slot lookups.
+
+    Fields mirror Settings one to one.
+    """
+
+    # AI Providers
+    openai_api_key: str | None
+    anthropic_api_key: str | None
+    default_agent_model: str
+    default_agent_temperature: float
+
+    # Target Project
+    target_project_path: Path
+    target_project_type: Literal["nextjs-supabase", "nextjs-only", "custom"]
+
+    # Supabase Configuration
+    supabase_url: str
+    supabase_anon_key: str | None
+    supabase_service_role_key: str | None
+
+    # GitHub Integration
+    github_token: str | None
+    github_repo: str | None
+    github_default_branch: str
+    auto_create_pr: bool
+
+    # Orchestrator Settings
+    max_parallel_agents: int
+    agent_timeout_seconds: int
+    debug: bool
+    log_level: str
+    workspace_dir: Path
+    cache_dir: Path
+
+    # Automation Settings
+    enable_auto_commit: bool
+    enable_auto_pr: bool
+    enable_auto_test: bool
+    enable_auto_security_scan: bool
+
+    # Agent Phase Configuration
+    enable_product_phase: bool
+    enable_architecture_phase: bool
+    enable_implementation_phase: bool
+    enable_testing_phase: bool
+    enable_review_phase: bool
+    enable_deployment_phase: bool
+
+    # Specific Agents
+    enable_product_manager: bool
+    enable_ux_researcher: bool
+    enable_business_analyst: bool
+    enable_solutions_architect: bool
+    enable_database_architect: bool
+    enable_security_architect: bool
+    enable_database_engineer: bool
+    enable_backend_engineer: bool
+    enable_frontend_engineer: bool
+    enable_qa_engineer: bool
+    enable_e2e_test_engineer: bool
+    enable_db_test_engineer: bool
+    enable_security_engineer: bool
+    enable_code_reviewer: bool
+    enable_performance_engineer: bool
+    enable_technical_writer: bool
+    enable_devops_engineer: bool
+
+    # Quality Gates
+    min_test_coverage: int
+    max_bundle_size_increase: int
+    fail_on_security_vulnerabilities: bool
+    fail_on_typescript_errors: bool
+    fail_on_failed_tests: bool
+
+    # Notifications
+    slack_webhook_url: str | None
+    discord_webhook_url: str | None
+    smtp_host: str | None
+    smtp_port: int
+    smtp_user: str | None
+    smtp_password: str | None
+    notification_email: str | None
+
+    # Advanced Settings
+    agent_max_retries: int
+    template_dir: Path
+    enable_streaming: bool
+    enable_llm_cache: bool
+    llm_cache_ttl_seconds: int
+    llm_max_concurrent_requests: int
+    llm_max_retries: int
+    enable_speculative_prewarm: bool
+    enable_review_batching: bool
+    save_agent_conversations: bool
+    conversation_dir: Path
 
 
-# Global settings instance
-settings = Settings()
+@functools.lru_cache(maxsize=1)
+def get_settings_snapshot() -> SettingsSnapshot:
+    """Get a read-only snapshot of the settings, taken on first use"""
+    settings = get_settings()
+    return SettingsSnapshot(
+        **{
+            field.name: getattr(settings, field.name)
+            for field in dataclasses.fields(SettingsSnapshot)
+        }
+    )
@@ -0,0 +1,11 @@
+"""
+Console output shared by the CLI and the orchestrator
+"""
+
+from rich.console import Console
+from rich.text import Text
+
+console = Console()
+
+# Rule framing the wave headers, styled once rather than parsed from markup
+WAVE_BAR = Text("=" * 60, style="bold magenta")
@@ -2,15 +2,17 @@
 Data models for TAC-9 Orchestrator
 """
 
+import time
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, Field, PrivateAttr
 
 
-class SDLCPhase(str, Enum):
+class SDLCPhase(StrEnum):
     """SDLC Phase enumeration"""
 
     PRODUCT = "product"
@@ -21,7 +23,7 @@ class SDLCPhase(str, Enum):
     DEPLOYMENT = "deployment"
 
 
-class AgentRole(str, Enum):
+class AgentRole(StrEnum):
     """Agent role enumeration"""
 
     # Product Phase
@@ -54,7 +56,7 @@ class AgentRole(str, Enum):
     DEVOPS_ENGINEER = "devops-engineer"
 
 
-class AgentStatus(str, Enum):
+class AgentStatus(StrEnum):
     """Agent execution status"""
 
     PENDING = "pending"
@@ -64,7 +66,7 @@ class AgentStatus(str, Enum):
     SKIPPED = "skipped"
 
 
-class WorkflowMode(str, Enum):
+class WorkflowMode(StrEnum):
     """Workflow execution mode"""
 
     FULL = "full"  # Complete SDLC
@@ -97,8 +99,21 @@ class AgentTask(BaseModel):
     status: AgentStatus = AgentStatus.PENDING
     started_at: datetime | None = None
     completed_at: datetime | None = None
+    # Monotonic time.perf_counter_ns() readings; used for durations, while
+    # the datetimes above are for display
+    started_ns: int | None = None
+    completed_ns: int | None = None
     error: str | None = None
     retry_count: int = 0
+    # Seconds spent in each attempt, including failed ones
+    attempt_durations: list[float] = Field(default_factory=list)
+
+    @property
+    def duration(self) -> float | None:
+        """Seconds from start to completion, including retries"""
+        if self.started_ns is None or self.completed_ns is None:
+            return None
+        return (self.completed_ns - self.started_ns) / 1e9
 
 
 class Deliverable(BaseModel):
@@ -122,6 +137,23 @@ class QualityGate(BaseModel):
     details: dict[str, Any] = Field(default_factory=dict)
 
 
+# Subdirectories created in every feature workspace: each phase directory
+# plus the nested directories agents write deliverables into
+WORKSPACE_SUBDIRS = (
+    "01-prd",
+    "02-architecture",
+    "03-database",
+    "04-backend",
+    "05-frontend",
+    "05-frontend/components",
+    "06-tests",
+    "06-tests/db",
+    "06-tests/e2e",
+    "07-reviews",
+    "08-docs",
+)
+
+
 class WorkspaceContext(BaseModel):
     """Shared context for a feature workspace"""
 
@@ -136,6 +168,12 @@ class WorkspaceContext(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
+    subdirs: dict[str, Path] = Field(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Resolve the subdirectory paths once per workspace"""
+        if not self.subdirs:
+            self.subdirs = {name: self.workspace_path / name for name in WORKSPACE_SUBDIRS}
 
     def add_deliverable(self, deliverable: Deliverable) -> None:
         """Add a deliverable to the workspace"""
@@ -167,20 +205,66 @@ class WorkflowExecution(BaseModel):
     current_phase: SDLCPhase | None = None
     started_at: datetime = Field(default_factory=datetime.now)
     completed_at: datetime | None = None
+    # Monotonic time.perf_counter_ns() readings, for durations
+    started_ns: int = Field(default_factory=time.perf_counter_ns)
+    completed_ns: int | None = None
     status: AgentStatus = AgentStatus.PENDING
     error: str | None = None
+    _feature_request_json: bytes | None = PrivateAttr(default=None)
+    # Tasks by status, keyed by id(task), covering tasks[:_indexed]; tasks
+    # appended later are picked up on the next query, and status changes go
+    # through set_task_status, so status queries don't scan every task
+    _tasks_by_status: dict[AgentStatus, dict[int, AgentTask]] = PrivateAttr(default_factory=dict)
+    _indexed: int = PrivateAttr(default=0)
+
+    @property
+    def feature_request_json(self) -> bytes:
+        """The feature request as JSON with sorted keys, serialized once and shared"""
+        if self._feature_request_json is None:
+            self._feature_request_json = orjson.dumps(
+                self.feature_request.model_dump(mode="json"), option=orjson.OPT_SORT_KEYS
+            )
+        return self._feature_request_json
+
+    @property
+    def duration(self) -> float | None:
+        """Seconds from start to completion"""
+        if self.completed_ns is None:
+            return None
+        return (self.completed_ns - self.started_ns) / 1e9
 
     def add_task(self, task: AgentTask) -> None:
         """Add a task to the workflow"""
         self.tasks.append(task)
 
+    def set_task_status(self, task: AgentTask, status: AgentStatus) -> None:
+        """Set the status of one of the workflow's tasks"""
+        index = self._status_index()
+        index.get(task.status, {}).pop(id(task), None)
+        task.status = status
+        index.setdefault(status, {})[id(task)] = task
+
+    def _status_index(self) -> dict[AgentStatus, dict[int, AgentTask]]:
+        """Get the status index, after indexing any tasks added since the last query"""
+        if len(self.tasks) < self._indexed:
+            self._tasks_by_status.clear()
+            self._indexed = 0
+        for task in self.tasks[self._indexed :]:
+            self._tasks_by_status.setdefault(task.status, {})[id(task)] = task
+        self._indexed = len(self.tasks)
+        return self._tasks_by_status
+
     def get_tasks_by_phase(self, phase: SDLCPhase) -> list[AgentTask]:
         """Get all tasks for a specific phase"""
         return [t for t in self.tasks if t.phase == phase]
 
     def get_tasks_by_status(self, status: AgentStatus) -> list[AgentTask]:
         """Get all tasks with a specific status"""
-        return [t for t in self.tasks if t.status == status]
+        return list(self._status_index().get(status, {}).values())
+
+    def count_tasks_by_status(self, status: AgentStatus) -> int:
+        """Count the tasks with a specific status"""
+        return len(self._status_index().get(status, ()))
 
     def is_phase_complete(self, phase: SDLCPhase) -> bool:
         """Check if a phase is complete"""
@@ -191,7 +275,7 @@ class WorkflowExecution(BaseModel):
 
     def has_failed_tasks(self) -> bool:
         """Check if any tasks failed"""
-        return any(t.status == AgentStatus.FAILED for t in self.tasks)
+        return bool(self._status_index().get(AgentStatus.FAILED))
 
 
 class AgentConfig(BaseModel):
@@ -3,13 +3,22 @@ Main Orchestrator - Coordinates specialist agents through SDLC workflow
 """
 
 import asyncio
+import contextlib
+import random
+import re
+import time
 import uuid
+from collections.abc import Mapping
+from contextlib import AbstractAsyncContextManager
 from datetime import datetime
+from types import MappingProxyType
 
-from rich.console import Console
+from rich.text import Text
 
-from agents.base import AgentInput
-from orchestrator.core.config import settings
+from agents.base import AgentInput, AgentOutput, BaseAgent, cancel_prewarmed
+from agents.review.batch_reviewer import BatchReviewAgent
+from orchestrator.core.config import get_settings_snapshot
+from orchestrator.core.console import WAVE_BAR, console
 from orchestrator.core.models import (
     AgentRole,
     AgentStatus,
@@ -22,7 +31,198 @@ from orchestrator.core.models import (
 )
 from orchestrator.services.agent_registry import agent_registry
 
-console = Console()
+# Feature name slugs: drop punctuation, then collapse whitespace and dashes
+_NON_SLUG = re.compile(r"[^\w\s-]")
+_DASH_RUNS = re.compile(r"[-\s]+")
+
+# Phases of the full workflow, in order
+WORKFLOW_PHASES = (
+    SDLCPhase.PRODUCT,
+    SDLCPhase.ARCHITECTURE,
+    SDLCPhase.IMPLEMENTATION,
+    SDLCPhase.TESTING,
+    SDLCPhase.REVIEW,
+    SDLCPhase.DEPLOYMENT,
+)
+
+# Agents producing the code that reviews and deployment work from
+_IMPLEMENTATION = (
+    AgentRole.DATABASE_ENGINEER,
+    AgentRole.BACKEND_ENGINEER,
+    AgentRole.FRONTEND_ENGINEER,
+)
+
+# Agents whose deliverables each agent builds on, across phases. Agents
+# without an entry only need the feature request.
+AGENT_DEPENDENCIES: dict[AgentRole, tuple[AgentRole, ...]] = {
+    # Product
+    AgentRole.UX_RESEARCHER: (AgentRole.PRODUCT_MANAGER,),
+    AgentRole.BUSINESS_ANALYST: (AgentRole.PRODUCT_MANAGER,),
+    # Architecture
+    AgentRole.SOLUTIONS_ARCHITECT: (
+        AgentRole.PRODUCT_MANAGER,
+        AgentRole.UX_RESEARCHER,
+        AgentRole.BUSINESS_ANALYST,
+    ),
+    AgentRole.DATABASE_ARCHITECT: (AgentRole.PRODUCT_MANAGER, AgentRole.BUSINESS_ANALYST),
+    AgentRole.SECURITY_ARCHITECT: (AgentRole.SOLUTIONS_ARCHITECT, AgentRole.DATABASE_ARCHITECT),
+    # Implementation
+    AgentRole.DATABASE_ENGINEER: (AgentRole.DATABASE_ARCHITECT, AgentRole.SECURITY_ARCHITECT),
+    AgentRole.BACKEND_ENGINEER: (
+        AgentRole.SOLUTIONS_ARCHITECT,
+        AgentRole.DATABASE_ARCHITECT,
+        AgentRole.SECURITY_ARCHITECT,
+    ),
+    AgentRole.FRONTEND_ENGINEER: (AgentRole.UX_RESEARCHER, AgentRole.SOLUTIONS_ARCHITECT),
+    # Testing
+    AgentRole.QA_ENGINEER: (AgentRole.BUSINESS_ANALYST, AgentRole.SOLUTIONS_ARCHITECT),
+    AgentRole.E2E_TEST_ENGINEER: (
+        AgentRole.BUSINESS_ANALYST,
+        AgentRole.BACKEND_ENGINEER,
+        AgentRole.FRONTEND_ENGINEER,
+    ),
+    AgentRole.DB_TEST_ENGINEER: (AgentRole.DATABASE_ENGINEER,),
+    # Review
+    AgentRole.SECURITY_ENGINEER: _IMPLEMENTATION,
+    AgentRole.CODE_REVIEWER: _IMPLEMENTATION,
+    AgentRole.PERFORMANCE_ENGINEER: _IMPLEMENTATION,
+    # Deployment
+    AgentRole.TECHNICAL_WRITER: (AgentRole.PRODUCT_MANAGER, AgentRole.SOLUTIONS_ARCHITECT),
+    AgentRole.DEVOPS_ENGINEER: _IMPLEMENTATION,
+}
+
+# Agents of each phase, in their preferred order
+_PHASE_AGENTS: Mapping[SDLCPhase, tuple[AgentRole, ...]] = MappingProxyType(
+    {
+        SDLCPhase.PRODUCT: (
+            AgentRole.PRODUCT_MANAGER,
+            AgentRole.UX_RESEARCHER,
+            AgentRole.BUSINESS_ANALYST,
+        ),
+        SDLCPhase.ARCHITECTURE: (
+            AgentRole.SOLUTIONS_ARCHITECT,
+            AgentRole.DATABASE_ARCHITECT,
+            AgentRole.SECURITY_ARCHITECT,
+        ),
+        SDLCPhase.IMPLEMENTATION: (
+            AgentRole.DATABASE_ENGINEER,
+            AgentRole.BACKEND_ENGINEER,
+            AgentRole.FRONTEND_ENGINEER,
+        ),
+        SDLCPhase.TESTING: (
+            AgentRole.QA_ENGINEER,
+            AgentRole.E2E_TEST_ENGINEER,
+            AgentRole.DB_TEST_ENGINEER,
+        ),
+        SDLCPhase.REVIEW: (
+            AgentRole.SECURITY_ENGINEER,
+            AgentRole.CODE_REVIEWER,
+            AgentRole.PERFORMANCE_ENGINEER,
+        ),
+        SDLCPhase.DEPLOYMENT: (
+            AgentRole.TECHNICAL_WRITER,
+            AgentRole.DEVOPS_ENGINEER,
+        ),
+    }
+)
+
+_AGENT_TO_PHASE: Mapping[AgentRole, SDLCPhase] = MappingProxyType(
+    {role: phase for phase, roles in _PHASE_AGENTS.items() for role in roles}
+)
+
+# Settings flag that enables each phase
+_PHASE_FLAGS: Mapping[SDLCPhase, str] = MappingProxyType(
+    {
+        SDLCPhase.PRODUCT: "enable_product_phase",
+        SDLCPhase.ARCHITECTURE: "enable_architecture_phase",
+        SDLCPhase.IMPLEMENTATION: "enable_implementation_phase",
+        SDLCPhase.TESTING: "enable_testing_phase",
+        SDLCPhase.REVIEW: "enable_review_phase",
+        SDLCPhase.DEPLOYMENT: "enable_deployment_phase",
+    }
+)
+
+# Settings flag that enables each agent
+_AGENT_FLAGS: Mapping[AgentRole, str] = MappingProxyType(
+    {
+        AgentRole.PRODUCT_MANAGER: "enable_product_manager",
+        AgentRole.UX_RESEARCHER: "enable_ux_researcher",
+        AgentRole.BUSINESS_ANALYST: "enable_business_analyst",
+        AgentRole.SOLUTIONS_ARCHITECT: "enable_solutions_architect",
+        AgentRole.DATABASE_ARCHITECT: "enable_database_architect",
+        AgentRole.SECURITY_ARCHITECT: "enable_security_architect",
+        AgentRole.DATABASE_ENGINEER: "enable_database_engineer",
+        AgentRole.BACKEND_ENGINEER: "enable_backend_engineer",
+        AgentRole.FRONTEND_ENGINEER: "enable_frontend_engineer",
+        AgentRole.QA_ENGINEER: "enable_qa_engineer",
+        AgentRole.E2E_TEST_ENGINEER: "enable_e2e_test_engineer",
+        AgentRole.DB_TEST_ENGINEER: "enable_db_test_engineer",
+        AgentRole.SECURITY_ENGINEER: "enable_security_engineer",
+        AgentRole.CODE_REVIEWER: "enable_code_reviewer",
+        AgentRole.PERFORMANCE_ENGINEER: "enable_performance_engineer",
+        AgentRole.TECHNICAL_WRITER: "enable_technical_writer",
+        AgentRole.DEVOPS_ENGINEER: "enable_devops_engineer",
+    }
+)
+
+# Retry backoff: exponential from the base delay up to the cap, plus up to
+# one base delay of jitter so failed siblings don't retry in lockstep
+RETRY_BACKOFF_BASE_SECONDS = 1.0
+RETRY_BACKOFF_MAX_SECONDS = 30.0
+
+
+def _retry_delay(retry: int) -> float:
+    """Get the delay before a retry (1 for the first retry)"""
+    backoff = RETRY_BACKOFF_BASE_SECONDS * 2.0 ** (retry - 1)
+    return min(RETRY_BACKOFF_MAX_SECONDS, backoff) + random.uniform(0, RETRY_BACKOFF_BASE_SECONDS)
+
+
+def dependency_levels(roles: list[AgentRole]) -> list[list[AgentRole]]:
+    """
+    Group agents into levels whose members can run concurrently.
+
+    Topologically sorts roles by AGENT_DEPENDENCIES (Kahn's algorithm);
+    each level only depends on earlier levels. Dependencies on agents not
+    in roles (disabled, or not part of this run) are already satisfied;
+    their own dependencies are inherited, so ordering survives disabling
+    an agent in the middle of a chain.
+
+    Args:
+        roles: Agents to schedule, in their preferred order
+
+    Returns:
+        Levels of agents, in execution order
+    """
+    scheduled = set(roles)
+    pending = {role: _scheduled_dependencies(role, scheduled) for role in roles}
+    levels = []
+    while pending:
+        ready = [role for role, deps in pending.items() if not deps]
+        if not ready:
+            raise ValueError(f"Dependency cycle between agents: {[r.value for r in pending]}")
+        levels.append(ready)
+        for role in ready:
+            del pending[role]
+        for deps in pending.values():
+            deps.difference_update(ready)
+    return levels
+
+
+def _scheduled_dependencies(role: AgentRole, scheduled: set[AgentRole]) -> set[AgentRole]:
+    """Get the scheduled agents a role depends on, looking through unscheduled ones"""
+    deps: set[AgentRole] = set()
+    seen: set[AgentRole] = set()
+    stack = list(AGENT_DEPENDENCIES.get(role, ()))
+    while stack:
+        dep = stack.pop()
+        if dep in seen:
+            continue
+        seen.add(dep)
+        if dep in scheduled:
+            deps.add(dep)
+        else:
+            stack.extend(AGENT_DEPENDENCIES.get(dep, ()))
+    return deps
 
 
 class SDLCOrchestrator:
@@ -34,8 +234,12 @@ class SDLCOrchestrator:
     """
 
     def __init__(self):
-        self.settings = settings
+        self.settings = get_settings_snapshot()
         self.executions: dict[str, WorkflowExecution] = {}
+        # Shared across every phase so concurrent work never exceeds the limit
+        self._agent_semaphore = asyncio.Semaphore(self.settings.max_parallel_agents)
+        # The settings snapshot never changes, so neither does the plan
+        self._plan = self._build_plan()
 
     async def execute_feature_request(
         self,
@@ -82,6 +286,7 @@ class SDLCOrchestrator:
 
             execution.status = AgentStatus.COMPLETED
             execution.completed_at = datetime.now()
+            execution.completed_ns = time.perf_counter_ns()
 
             console.print("\n[bold green]✅ SDLC Orchestration Complete![/bold green]")
             self._print_summary(execution)
@@ -96,26 +301,7 @@ class SDLCOrchestrator:
 
     async def _execute_full_workflow(self, execution: WorkflowExecution) -> None:
         """Execute the complete SDLC workflow (all phases)"""
-        phases = [
-            SDLCPhase.PRODUCT,
-            SDLCPhase.ARCHITECTURE,
-            SDLCPhase.IMPLEMENTATION,
-            SDLCPhase.TESTING,
-            SDLCPhase.REVIEW,
-            SDLCPhase.DEPLOYMENT,
-        ]
-
-        for phase in phases:
-            if not self._is_phase_enabled(phase):
-                console.print(f"[yellow]⊘[/yellow] Phase {phase.value} is disabled, skipping")
-                continue
-
-            console.print(f"\n[bold magenta]{'=' * 60}[/bold magenta]")
-            console.print(f"[bold magenta]PHASE: {phase.value.upper()}[/bold magenta]")
-            console.print(f"[bold magenta]{'=' * 60}[/bold magenta]\n")
-
-            execution.current_phase = phase
-            await self._execute_phase_agents(execution, phase)
+        await self._execute_waves(execution, self._workflow_agents(WORKFLOW_PHASES))
 
     async def _execute_from_prd(self, execution: WorkflowExecution) -> None:
         """Execute workflow starting from existing PRD (skip Product phase)"""
@@ -127,19 +313,94 @@ class SDLCOrchestrator:
         console.print(f"[green]✓[/green] Loading PRD from: {prd_path}")
 
         # Execute remaining phases
-        phases = [
-            SDLCPhase.ARCHITECTURE,
-            SDLCPhase.IMPLEMENTATION,
-            SDLCPhase.TESTING,
-            SDLCPhase.REVIEW,
-            SDLCPhase.DEPLOYMENT,
-        ]
+        await self._execute_waves(execution, self._workflow_agents(WORKFLOW_PHASES[1:]))
 
+    def _workflow_agents(self, phases: tuple[SDLCPhase, ...]) -> list[AgentRole]:
+        """Get the enabled agents of the enabled phases, in phase order"""
+        roles = []
         for phase in phases:
-            if not self._is_phase_enabled(phase):
+            enabled, phase_roles = self._plan[phase]
+            if not enabled:
+                console.print(f"[yellow]⊘[/yellow] Phase {phase.value} is disabled, skipping")
                 continue
-            execution.current_phase = phase
-            await self._execute_phase_agents(execution, phase)
+            roles += phase_roles
+        return roles
+
+    def _build_plan(self) -> Mapping[SDLCPhase, tuple[bool, tuple[AgentRole, ...]]]:
+        """Resolve, per phase, whether it is enabled and which of its agents are"""
+        return MappingProxyType(
+            {
+                phase: (
+                    self._is_phase_enabled(phase),
+                    tuple(
+                        r for r in self._get_agents_for_phase(phase) if self._is_agent_enabled(r)
+                    ),
+                )
+                for phase in WORKFLOW_PHASES
+            }
+        )
+
+    async def _execute_waves(self, execution: WorkflowExecution, roles: list[AgentRole]) -> None:
+        """
+        Execute agents across phases in dependency waves.
+
+        Each wave holds every agent whose dependencies are done, whatever
+        its phase, so e.g. the Technical Writer starts as soon as the
+        architecture exists instead of waiting for the review phase.
+        """
+        waves = dependency_levels(roles)
+
+        prewarmed: list[asyncio.Future[str]] = []
+        try:
+            for i, wave in enumerate(waves):
+                phases = sorted(
+                    {self._get_phase_for_agent(role) for role in wave}, key=WORKFLOW_PHASES.index
+                )
+                phase_names = ", ".join(phase.value.upper() for phase in phases)
+
+                console.line()
+                console.print(
+                    WAVE_BAR,
+                    Text(f"WAVE {i + 1}/{len(waves)}: {phase_names}", style="bold magenta"),
+                    WAVE_BAR,
+                    sep="\n",
+                    end="\n\n",
+                )
+
+                execution.current_phase = phases[-1]
+                if i + 1 < len(waves):
+                    prewarmed += self._prewarm_agents(execution, waves[i + 1])
+                await self._execute_wave(execution, wave)
+        finally:
+            cancel_prewarmed(prewarmed)
+
+    def _prewarm_agents(
+        self, execution: WorkflowExecution, roles: list[AgentRole]
+    ) -> list[asyncio.Future[str]]:
+        """
+        Speculatively start the LLM requests of the next wave.
+
+        Agent prompts are built from the workspace context, so they are
+        known before the current wave finishes; a request whose prompts
+        end up different is simply never used and cancelled at the end.
+        Review agents whose requests the wave's batched call will answer
+        are skipped.
+        """
+        if not self.settings.enable_speculative_prewarm:
+            return []
+
+        batched = self._batched_reviewers(roles)
+
+        agent_input = AgentInput.model_construct(
+            workspace_context=execution.workspace_context,
+            previous_deliverables=execution.workspace_context.deliverables,
+            metadata={},
+        )
+        return [
+            agent_registry.get_agent(role).prewarm(agent_input)
+            for role in roles
+            if role not in batched
+        ]
 
     async def _execute_phase(self, execution: WorkflowExecution, phase: SDLCPhase) -> None:
         """Execute a specific phase only"""
@@ -155,108 +416,189 @@ class SDLCOrchestrator:
 
     async def _execute_phase_agents(self, execution: WorkflowExecution, phase: SDLCPhase) -> None:
         """Execute all agents for a specific phase"""
-        agent_roles = self._get_agents_for_phase(phase)
-
-        # Create tasks for all agents in this phase
-        tasks = [
-            self._create_agent_task(execution, role)
-            for role in agent_roles
-            if self._is_agent_enabled(role)
-        ]
+        _, roles = self._plan[phase]
 
-        if not tasks:
+        if not roles:
             console.print(f"[yellow]No agents enabled for phase {phase.value}[/yellow]")
             return
 
-        # Determine if we can run agents in parallel for this phase
-        can_parallelize = phase in [
-            SDLCPhase.IMPLEMENTATION,
-            SDLCPhase.TESTING,
-            SDLCPhase.REVIEW,
-        ]
+        # Dependencies on other phases' agents count as satisfied
+        for level in dependency_levels(list(roles)):
+            await self._execute_wave(execution, level)
+
+    async def _execute_wave(self, execution: WorkflowExecution, roles: list[AgentRole]) -> None:
+        """Execute agents that don't consume each other's deliverables, concurrently"""
+        tasks = [self._create_agent_task(execution, role) for role in roles]
+        async with self._review_batch(execution, roles):
+            if len(tasks) > 1:
+                console.print(f"[cyan]⚙️  Running {len(tasks)} agents in parallel...[/cyan]")
+                await self._run_agents_parallel(execution, tasks)
+            else:
+                await self._run_agents_sequential(execution, tasks)
+
+    def _review_batch(
+        self, execution: WorkflowExecution, roles: list[AgentRole]
+    ) -> AbstractAsyncContextManager[None]:
+        """Answer the review agents' LLM requests with one call, when batching is enabled"""
+        reviewers = self._batched_reviewers(roles)
+        if not reviewers:
+            return contextlib.nullcontext()
+
+        console.print(f"[cyan]⚙️  Batching {len(reviewers)} reviews into one LLM call...[/cyan]")
+        agent_input = AgentInput.model_construct(
+            workspace_context=execution.workspace_context,
+            previous_deliverables=execution.workspace_context.deliverables,
+            metadata={},
+        )
+        return BatchReviewAgent(reviewers).batched(
+            agent_input, timeout=self.settings.agent_timeout_seconds
+        )
 
-        if can_parallelize and len(tasks) > 1:
-            console.print(f"[cyan]⚙️  Running {len(tasks)} agents in parallel...[/cyan]")
-            await self._run_agents_parallel(execution, tasks)
-        else:
-            console.print(f"[cyan]⚙️  Running {len(tasks)} agents sequentially...[/cyan]")
-            await self._run_agents_sequential(execution, tasks)
+    def _batched_reviewers(self, roles: list[AgentRole]) -> list[AgentRole]:
+        """Get the review agents of a wave whose LLM requests are batched into one call"""
+        reviewers = [role for role in roles if role in BatchReviewAgent.ROLES]
+        if not self.settings.enable_review_batching or len(reviewers) < 2:
+            return []
+        return reviewers
 
-    async def _run_agents_parallel(self, execution: WorkflowExecution, tasks: list[AgentTask]) -> None:
+    async def _run_agents_parallel(
+        self, execution: WorkflowExecution, tasks: list[AgentTask]
+    ) -> None:
         """Run multiple agents in parallel with concurrency limit"""
-        semaphore = asyncio.Semaphore(self.settings.max_parallel_agents)
+        errors: list[Exception] = []
 
         async def run_with_semaphore(task: AgentTask):
-            async with semaphore:
-                await self._run_agent(execution, task)
-
-        await asyncio.gather(*[run_with_semaphore(task) for task in tasks])
-
-    async def _run_agents_sequential(self, execution: WorkflowExecution, tasks: list[AgentTask]) -> None:
+            async with self._agent_semaphore:
+                try:
+                    await self._run_agent(execution, task)
+                except Exception as e:
+                    errors.append(e)
+
+        # Failures are collected rather than raised inside the group, so one
+        # agent failing doesn't cancel its siblings and their deliverables
+        # are kept; cancelling the phase still cancels every agent
+        async with asyncio.TaskGroup() as tg:
+            for task in tasks:
+                tg.create_task(run_with_semaphore(task))
+
+        # Surface the first failure
+        if errors:
+            raise errors[0]
+
+    async def _run_agents_sequential(
+        self, execution: WorkflowExecution, tasks: list[AgentTask]
+    ) -> None:
         """Run agents sequentially (one after another)"""
         for task in tasks:
             await self._run_agent(execution, task)
 
     async def _run_agent(self, execution: WorkflowExecution, task: AgentTask) -> None:
-        """Run a single agent task"""
-        agent_name = task.agent_role.value
-        console.print(f"  [cyan]→[/cyan] Starting {agent_name}...")
-
-        task.status = AgentStatus.RUNNING
-        task.started_at = datetime.now()
+        """Run a single agent task, retrying failed attempts with backoff"""
+        max_retries = self.settings.agent_max_retries
         execution.add_task(task)
 
-        try:
-            # Load agent from registry
-            agent = agent_registry.get_agent(task.agent_role)
-
-            # Prepare agent input
-            agent_input = AgentInput(
-                workspace_context=execution.workspace_context,
-                previous_deliverables=execution.workspace_context.deliverables,
-                metadata=task.inputs,
-            )
+        while True:
+            attempt_started = self._transition(execution, task, AgentStatus.RUNNING)
 
-            # Execute agent
-            output = await agent.execute(agent_input)
+            try:
+                output = await self._attempt_agent(execution, task)
+                break
+            except Exception as e:
+                failed_ns = self._transition(execution, task, AgentStatus.FAILED, error=e)
+                task.attempt_durations.append((failed_ns - attempt_started) / 1e9)
 
-            # Update workspace with deliverables and quality gates
-            for deliverable in output.deliverables:
-                execution.workspace_context.add_deliverable(deliverable)
+                if task.retry_count >= max_retries:
+                    raise
 
-            for gate in output.quality_gates:
-                execution.workspace_context.add_quality_gate(gate)
+                task.retry_count += 1
+                delay = _retry_delay(task.retry_count)
+                console.print(
+                    f"  [yellow]↻[/yellow] Retrying {task.agent_role.value} in {delay:.1f}s "
+                    f"({task.retry_count}/{max_retries})..."
+                )
+                self._transition(execution, task, AgentStatus.PENDING)
+                await asyncio.sleep(delay)
 
-            # Update task
-            task.status = AgentStatus.COMPLETED
-            task.completed_at = datetime.now()
-            task.outputs = output.metadata
+        task.outputs = output.metadata
+        completed_ns = self._transition(execution, task, AgentStatus.COMPLETED)
+        task.attempt_durations.append((completed_ns - attempt_started) / 1e9)
 
-            duration = (task.completed_at - task.started_at).total_seconds()
-            console.print(f"  [green]✓[/green] {agent_name} completed ({duration:.1f}s)")
+        # Update workspace with deliverables and quality gates
+        for deliverable in output.deliverables:
+            execution.workspace_context.add_deliverable(deliverable)
 
-            # Show deliverables
-            if output.deliverables:
-                for d in output.deliverables:
-                    console.print(f"    [dim]→ {d.name}: {d.path.name}[/dim]")
+        for gate in output.quality_gates:
+            execution.workspace_context.add_quality_gate(gate)
 
-        except Exception as e:
-            task.status = AgentStatus.FAILED
-            task.error = str(e)
-            task.completed_at = datetime.now()
+        # Show deliverables
+        if output.deliverables:
+            for d in output.deliverables:
+                console.print(f"    [dim]→ {d.name}: {d.path.name}[/dim]")
 
-            console.print(f"  [red]✗[/red] {agent_name} failed: {e}")
+    def _transition(
+        self,
+        execution: WorkflowExecution,
+        task: AgentTask,
+        status: AgentStatus,
+        *,
+        error: Exception | None = None,
+    ) -> int:
+        """
+        Move a task to a new status, updating its timestamps and error and
+        printing the change.
 
-            if task.retry_count < self.settings.agent_max_retries:
-                task.retry_count += 1
-                console.print(
-                    f"  [yellow]↻[/yellow] Retrying {agent_name} "
-                    f"({task.retry_count}/{self.settings.agent_max_retries})..."
-                )
-                task.status = AgentStatus.PENDING
-                await self._run_agent(execution, task)
+        Args:
+            execution: Workflow the task belongs to
+            task: Task to update
+            status: New status
+            error: Exception that failed the attempt, for FAILED
+
+        Returns:
+            time.perf_counter_ns() reading of the change
+        """
+        now_ns = time.perf_counter_ns()
+        execution.set_task_status(task, status)
+        agent_name = task.agent_role.value
+
+        if status is AgentStatus.RUNNING:
+            if task.started_ns is None:
+                task.started_at = datetime.now()
+                task.started_ns = now_ns
+            console.print(f"  [cyan]→[/cyan] Starting {agent_name}...")
+        elif status is AgentStatus.PENDING:
+            # Going to be retried, so not finished after all
+            task.completed_at = None
+            task.completed_ns = None
+        else:
+            task.completed_at = datetime.now()
+            task.completed_ns = now_ns
+            if status is AgentStatus.FAILED:
+                task.error = str(error)
+                console.print(f"  [red]✗[/red] {agent_name} failed: {error}")
             else:
-                raise
+                task.error = None
+                console.print(f"  [green]✓[/green] {agent_name} completed ({task.duration:.1f}s)")
+
+        return now_ns
+
+    async def _attempt_agent(self, execution: WorkflowExecution, task: AgentTask) -> AgentOutput:
+        """Execute one attempt of an agent task, bounded by the agent timeout"""
+        # Load agent from registry
+        agent = agent_registry.get_agent(task.agent_role)
+
+        # Prepare agent input (fields are already validated models)
+        agent_input = AgentInput.model_construct(
+            workspace_context=execution.workspace_context,
+            previous_deliverables=execution.workspace_context.deliverables,
+            metadata=task.inputs,
+        )
+
+        # Execute agent
+        timeout = self.settings.agent_timeout_seconds
+        try:
+            return await asyncio.wait_for(agent.execute(agent_input), timeout=timeout)
+        except TimeoutError as e:
+            raise TimeoutError(f"timed out after {timeout}s") from e
 
     def _create_agent_task(self, execution: WorkflowExecution, agent_role: AgentRole) -> AgentTask:
         """Create a task for an agent"""
@@ -268,7 +610,7 @@ class SDLCOrchestrator:
             inputs={
                 "workspace_path": str(execution.workspace_context.workspace_path),
                 "project_path": str(execution.workspace_context.project_path),
-                "feature_request": execution.feature_request.model_dump(),
+                "feature_request_json": execution.feature_request_json,
             },
         )
 
@@ -277,133 +619,84 @@ class SDLCOrchestrator:
         # Generate feature name from description
         feature_name = self._generate_feature_name(request.description)
 
-        # Create workspace directory
-        workspace_path = self.settings.workspace_dir / f"feature-{feature_name}"
-        workspace_path.mkdir(parents=True, exist_ok=True)
-
-        # Create subdirectories
-        subdirs = [
-            "01-prd",
-            "02-architecture",
-            "03-database",
-            "04-backend",
-            "05-frontend",
-            "06-tests",
-            "07-reviews",
-            "08-docs",
-        ]
-        for subdir in subdirs:
-            (workspace_path / subdir).mkdir(exist_ok=True)
-
-        return WorkspaceContext(
+        workspace = WorkspaceContext(
             feature_name=feature_name,
-            workspace_path=workspace_path,
+            workspace_path=self.settings.workspace_dir / f"feature-{feature_name}",
             project_path=self.settings.target_project_path,
             request=request,
         )
 
+        # Create the workspace and its subdirectories up front so agents can
+        # write deliverables without creating parents; the mkdirs run in
+        # threads, concurrently, to keep the event loop free
+        await asyncio.to_thread(workspace.workspace_path.mkdir, parents=True, exist_ok=True)
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(subdir.mkdir, parents=True, exist_ok=True)
+                for subdir in workspace.subdirs.values()
+            )
+        )
+
+        return workspace
+
     def _generate_feature_name(self, description: str) -> str:
         """Generate a slug-friendly feature name from description"""
-        import re
-
-        name = description.lower()
-        name = re.sub(r"[^\w\s-]", "", name)
-        name = re.sub(r"[-\s]+", "-", name)
+        # Only the start of a long description can reach the slug
+        name = description[:200].lower()
+        name = _NON_SLUG.sub("", name)
+        name = _DASH_RUNS.sub("-", name)
         name = name[:50]  # Limit length
         return name.strip("-")
 
-    def _get_agents_for_phase(self, phase: SDLCPhase) -> list[AgentRole]:
+    def _get_agents_for_phase(self, phase: SDLCPhase) -> tuple[AgentRole, ...]:
         """Get all agents for a specific phase"""
-        phase_agents = {
-            SDLCPhase.PRODUCT: [
-                AgentRole.PRODUCT_MANAGER,
-                AgentRole.UX_RESEARCHER,
-                AgentRole.BUSINESS_ANALYST,
-            ],
-            SDLCPhase.ARCHITECTURE: [
-                AgentRole.SOLUTIONS_ARCHITECT,
-                AgentRole.DATABASE_ARCHITECT,
-                AgentRole.SECURITY_ARCHITECT,
-            ],
-            SDLCPhase.IMPLEMENTATION: [
-                AgentRole.DATABASE_ENGINEER,
-                AgentRole.BACKEND_ENGINEER,
-                AgentRole.FRONTEND_ENGINEER,
-            ],
-            SDLCPhase.TESTING: [
-                AgentRole.QA_ENGINEER,
-                AgentRole.E2E_TEST_ENGINEER,
-                AgentRole.DB_TEST_ENGINEER,
-            ],
-            SDLCPhase.REVIEW: [
-                AgentRole.SECURITY_ENGINEER,
-                AgentRole.CODE_REVIEWER,
-                AgentRole.PERFORMANCE_ENGINEER,
-            ],
-            SDLCPhase.DEPLOYMENT: [
-                AgentRole.TECHNICAL_WRITER,
-                AgentRole.DEVOPS_ENGINEER,
-            ],
-        }
-        return phase_agents.get(phase, [])
+        return _PHASE_AGENTS.get(phase, ())
 
     def _get_phase_for_agent(self, agent_role: AgentRole) -> SDLCPhase:
         """Get the phase for a specific agent"""
-        for phase in SDLCPhase:
-            if agent_role in self._get_agents_for_phase(phase):
-                return phase
-        raise ValueError(f"Unknown agent role: {agent_role}")
+        phase = _AGENT_TO_PHASE.get(agent_role)
+        if phase is None:
+            raise ValueError(f"Unknown agent role: {agent_role}")
+        return phase
 
     def _is_phase_enabled(self, phase: SDLCPhase) -> bool:
         """Check if a phase is enabled"""
-        phase_settings = {
-            SDLCPhase.PRODUCT: self.settings.enable_product_phase,
-            SDLCPhase.ARCHITECTURE: self.settings.enable_architecture_phase,
-            SDLCPhase.IMPLEMENTATION: self.settings.enable_implementation_phase,
-            SDLCPhase.TESTING: self.settings.enable_testing_phase,
-            SDLCPhase.REVIEW: self.settings.enable_review_phase,
-            SDLCPhase.DEPLOYMENT: self.settings.enable_deployment_phase,
-        }
-        return phase_settings.get(phase, True)
+        flag = _PHASE_FLAGS.get(phase)
+        return flag is None or getattr(self.settings, flag)
 
     def _is_agent_enabled(self, agent_role: AgentRole) -> bool:
-        """Check if an agent is enabled"""
-        agent_settings = {
-            AgentRole.PRODUCT_MANAGER: self.settings.enable_product_manager,
-            AgentRole.SOLUTIONS_ARCHITECT: self.settings.enable_solutions_architect,
-            AgentRole.DATABASE_ARCHITECT: self.settings.enable_database_architect,
-            AgentRole.DATABASE_ENGINEER: self.settings.enable_database_engineer,
-            AgentRole.BACKEND_ENGINEER: self.settings.enable_backend_engineer,
-            AgentRole.FRONTEND_ENGINEER: self.settings.enable_frontend_engineer,
-            AgentRole.E2E_TEST_ENGINEER: self.settings.enable_e2e_test_engineer,
-            AgentRole.DB_TEST_ENGINEER: self.settings.enable_db_test_engineer,
-            AgentRole.SECURITY_ENGINEER: self.settings.enable_security_engineer,
-            AgentRole.CODE_REVIEWER: self.settings.enable_code_reviewer,
-            AgentRole.PERFORMANCE_ENGINEER: self.settings.enable_performance_engineer,
-            AgentRole.TECHNICAL_WRITER: self.settings.enable_technical_writer,
-            AgentRole.DEVOPS_ENGINEER: self.settings.enable_devops_engineer,
-        }
-        return agent_settings.get(agent_role, True)
+        """Check if an agent is enabled (checked before the agent is ever built)"""
+        flag = _AGENT_FLAGS.get(agent_role)
+        return flag is None or getattr(self.settings, flag)
 
     def _print_summary(self, execution: WorkflowExecution) -> None:
         """Print execution summary"""
         console.print("\n[bold]Execution Summary:[/bold]")
-        console.print(f"  Feature: {execution.workspace_context.feature_name}")
-        console.print(f"  Workspace: {execution.workspace_context.workspace_path}")
+        console.print(f"  Feature: {execution.workspace_context.feature_name}", markup=False)
+        console.print(f"  Workspace: {execution.workspace_context.workspace_path}", markup=False)
 
-        duration = (execution.completed_at - execution.started_at).total_seconds()
-        console.print(f"  Duration: {duration:.1f}s")
+        console.print(f"  Duration: {execution.duration:.1f}s", markup=False)
 
         total_tasks = len(execution.tasks)
-        completed = len(execution.get_tasks_by_status(AgentStatus.COMPLETED))
-        failed = len(execution.get_tasks_by_status(AgentStatus.FAILED))
+        completed = execution.count_tasks_by_status(AgentStatus.COMPLETED)
+        failed = execution.count_tasks_by_status(AgentStatus.FAILED)
 
-        console.print(f"  Tasks: {completed}/{total_tasks} completed, {failed} failed")
+        console.print(
+            f"  Tasks: {completed}/{total_tasks} completed, {failed} failed", markup=False
+        )
 
         if execution.workspace_context.deliverables:
-            console.print(f"  Deliverables: {len(execution.workspace_context.deliverables)}")
+            console.print(
+                f"  Deliverables: {len(execution.workspace_context.deliverables)}", markup=False
+            )
 
         if execution.workspace_context.quality_gates:
             passed_gates = sum(1 for g in execution.workspace_context.quality_gates if g.passed)
             total_gates = len(execution.workspace_context.quality_gates)
-            console.print(f"  Quality Gates: {passed_gates}/{total_gates} passed")
+            console.print(f"  Quality Gates: {passed_gates}/{total_gates} passed", markup=False)
+
+        if self.settings.enable_llm_cache:
+            console.print(
+                f"  LLM Cache: {BaseAgent.cache_hits} hits, {BaseAgent.cache_misses} misses",
+                markup=False,
+            )
@@ -2,11 +2,8 @@
 TAC-9 Orchestrator - Main Entry Point
 """
 
-from rich.console import Console
-
 from orchestrator.cli import app
-
-console = Console()
+from orchestrator.core.console import console
 
 
 def main():
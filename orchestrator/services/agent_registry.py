@@ -2,78 +2,64 @@
 Agent Registry - Loads and manages specialist agents
 """
 
-from typing import Dict, Type
+import asyncio
+import importlib
 
 from agents.base import BaseAgent
 from orchestrator.core.models import AgentRole
 
-# Import all specialist agents
-from agents.product.product_manager import ProductManagerAgent
-from agents.product.ux_researcher import UXResearcherAgent
-from agents.product.business_analyst import BusinessAnalystAgent
-
-from agents.architecture.solutions_architect import SolutionsArchitectAgent
-from agents.architecture.database_architect import DatabaseArchitectAgent
-from agents.architecture.security_architect import SecurityArchitectAgent
-
-from agents.implementation.database_engineer import DatabaseEngineerAgent
-from agents.implementation.backend_engineer import BackendEngineerAgent
-from agents.implementation.frontend_engineer import FrontendEngineerAgent
-
-from agents.testing.qa_engineer import QAEngineerAgent
-from agents.testing.e2e_test_engineer import E2ETestEngineerAgent
-from agents.testing.db_test_engineer import DBTestEngineerAgent
-
-from agents.review.security_engineer import SecurityEngineerAgent
-from agents.review.code_reviewer import CodeReviewerAgent
-from agents.review.performance_engineer import PerformanceEngineerAgent
-
-from agents.deployment.technical_writer import TechnicalWriterAgent
-from agents.deployment.devops_engineer import DevOpsEngineerAgent
-
 
 class AgentRegistry:
     """
     Central registry for all specialist agents.
 
-    Maps agent roles to their implementation classes.
+    Maps agent roles to the module and name of their implementation classes.
+    Agent modules are imported on first use, so commands that never run an
+    agent don't pay for importing all of them.
     """
 
-    _agents: Dict[AgentRole, Type[BaseAgent]] = {
+    _agents: dict[AgentRole, tuple[str, str]] = {
         # Product Phase
-        AgentRole.PRODUCT_MANAGER: ProductManagerAgent,
-        AgentRole.UX_RESEARCHER: UXResearcherAgent,
-        AgentRole.BUSINESS_ANALYST: BusinessAnalystAgent,
+        AgentRole.PRODUCT_MANAGER: ("agents.product.product_manager", "ProductManagerAgent"),
+        AgentRole.UX_RESEARCHER: ("agents.product.ux_researcher", "UXResearcherAgent"),
+        AgentRole.BUSINESS_ANALYST: ("agents.product.business_analyst", "BusinessAnalystAgent"),
 
         # Architecture Phase
-        AgentRole.SOLUTIONS_ARCHITECT: SolutionsArchitectAgent,
-        AgentRole.DATABASE_ARCHITECT: DatabaseArchitectAgent,
-        AgentRole.SECURITY_ARCHITECT: SecurityArchitectAgent,
+        AgentRole.SOLUTIONS_ARCHITECT: ("agents.architecture.solutions_architect", "SolutionsArchitectAgent"),
+        AgentRole.DATABASE_ARCHITECT: ("agents.architecture.database_architect", "DatabaseArchitectAgent"),
+        AgentRole.SECURITY_ARCHITECT: ("agents.architecture.security_architect", "SecurityArchitectAgent"),
 
         # Implementation Phase
-        AgentRole.DATABASE_ENGINEER: DatabaseEngineerAgent,
-        AgentRole.BACKEND_ENGINEER: BackendEngineerAgent,
-        AgentRole.FRONTEND_ENGINEER: FrontendEngineerAgent,
+        AgentRole.DATABASE_ENGINEER: ("agents.implementation.database_engineer", "DatabaseEngineerAgent"),
+        AgentRole.BACKEND_ENGINEER: ("agents.implementation.backend_engineer", "BackendEngineerAgent"),
+        AgentRole.FRONTEND_ENGINEER: ("agents.implementation.frontend_engineer", "FrontendEngineerAgent"),
 
         # Testing Phase
-        AgentRole.QA_ENGINEER: QAEngineerAgent,
-        AgentRole.E2E_TEST_ENGINEER: E2ETestEngineerAgent,
-        AgentRole.DB_TEST_ENGINEER: DBTestEngineerAgent,
+        AgentRole.QA_ENGINEER: ("agents.testing.qa_engineer", "QAEngineerAgent"),
+        AgentRole.E2E_TEST_ENGINEER: ("agents.testing.e2e_test_engineer", "E2ETestEngineerAgent"),
+        AgentRole.DB_TEST_ENGINEER: ("agents.testing.db_test_engineer", "DBTestEngineerAgent"),
 
         # Review Phase
-        AgentRole.SECURITY_ENGINEER: SecurityEngineerAgent,
-        AgentRole.CODE_REVIEWER: CodeReviewerAgent,
-        AgentRole.PERFORMANCE_ENGINEER: PerformanceEngineerAgent,
+        AgentRole.SECURITY_ENGINEER: ("agents.review.security_engineer", "SecurityEngineerAgent"),
+        AgentRole.CODE_REVIEWER: ("agents.review.code_reviewer", "CodeReviewerAgent"),
+        AgentRole.PERFORMANCE_ENGINEER: ("agents.review.performance_engineer", "PerformanceEngineerAgent"),
 
         # Deployment Phase
-        AgentRole.TECHNICAL_WRITER: TechnicalWriterAgent,
-        AgentRole.DEVOPS_ENGINEER: DevOpsEngineerAgent,
+        AgentRole.TECHNICAL_WRITER: ("agents.deployment.technical_writer", "TechnicalWriterAgent"),
+        AgentRole.DEVOPS_ENGINEER: ("agents.deployment.devops_engineer", "DevOpsEngineerAgent"),
     }
 
+    # Agent classes resolved so far
+    _classes: dict[AgentRole, type[BaseAgent]] = {}
+
+    # Agents keep no per-execution state, so one instance per role is shared
+    # by every task, retry, and prewarm
+    _instances: dict[AgentRole, BaseAgent] = {}
+
     @classmethod
     def get_agent(cls, role: AgentRole) -> BaseAgent:
         """
-        Get an agent instance by role.
+        Get an agent instance by role, constructed on first use.
 
         Args:
             role: Agent role to instantiate
@@ -84,11 +70,43 @@ class AgentRegistry:
         Raises:
             ValueError: If agent role not found
         """
-        agent_class = cls._agents.get(role)
-        if not agent_class:
+        agent = cls._instances.get(role)
+        if agent is not None:
+            return agent
+
+        agent = cls._instances[role] = cls.get_agent_class(role)()
+        return agent
+
+    @classmethod
+    def get_agent_class(cls, role: AgentRole) -> type[BaseAgent]:
+        """
+        Get an agent class by role, importing its module on first use.
+
+        Args:
+            role: Agent role to look up
+
+        Returns:
+            Agent class
+
+        Raises:
+            ValueError: If agent role not found
+        """
+        agent_class = cls._classes.get(role)
+        if agent_class is not None:
+            return agent_class
+
+        target = cls._agents.get(role)
+        if not target:
             raise ValueError(f"No agent registered for role: {role}")
 
-        return agent_class()
+        module_path, class_name = target
+        cls._classes[role] = getattr(importlib.import_module(module_path), class_name)
+        return cls._classes[role]
+
+    @classmethod
+    async def preload_all(cls) -> None:
+        """Import every agent module on worker threads, ahead of first use"""
+        await asyncio.gather(*(asyncio.to_thread(cls.get_agent_class, role) for role in cls._agents))
 
     @classmethod
     def list_agents(cls) -> list[AgentRole]:
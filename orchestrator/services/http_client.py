@@ -0,0 +1,55 @@
+"""
+HTTP Clients - Pooled HTTP/2 connections for AI provider calls
+"""
+
+import asyncio
+import contextlib
+from collections.abc import Callable, Iterable
+from typing import Any
+
+
+def create_http_client(factory: Callable[..., Any]) -> Any:
+    """
+    Create a pooled HTTP/2 client for a provider SDK.
+
+    The LLM service keeps one client per provider, so agents running in
+    parallel multiplex over warm keep-alive connections instead of each
+    paying a TLS handshake. The owner closes it with ``aclose()``.
+
+    Args:
+        factory: The SDK's default async HTTP client class (keeps SDK defaults)
+
+    Returns:
+        Async HTTP client to pass as the SDK's ``http_client``
+    """
+    return factory(http2=True)
+
+
+async def warm_http_client(client: Any, url: str) -> None:
+    """
+    Open a pooled connection to a provider ahead of the first real call.
+
+    A HEAD request is enough to complete the TLS handshake and HTTP/2
+    settings exchange; the response itself is ignored, as are failures
+    (the real call will surface them).
+
+    Args:
+        client: Async HTTP client from create_http_client()
+        url: Provider API base URL
+    """
+    with contextlib.suppress(Exception):
+        await client.head(url)
+
+
+async def close_http_clients(clients: Iterable[Any]) -> None:
+    """
+    Close HTTP clients and their pooled connections.
+
+    Connections opened in an event loop that has since closed can't be
+    shut down from another one; those failures are ignored, leaving the
+    dropped connections to garbage collection.
+
+    Args:
+        clients: Async HTTP clients from create_http_client()
+    """
+    await asyncio.gather(*(client.aclose() for client in clients), return_exceptions=True)
@@ -2,12 +2,72 @@
 LLM Service - Handles calls to AI providers (Anthropic, OpenAI)
 """
 
-from typing import Optional
+import asyncio
+import functools
+from collections.abc import AsyncIterator
+from typing import Any, Optional
 
-from anthropic import Anthropic
-from openai import OpenAI
+import anthropic
+import openai
+from anthropic import AsyncAnthropic
+from openai import AsyncOpenAI
 
-from orchestrator.core.config import settings
+from orchestrator.core.config import get_settings
+from orchestrator.services.http_client import (
+    close_http_clients,
+    create_http_client,
+    warm_http_client,
+)
+
+# Map friendly names to API model IDs
+ANTHROPIC_MODELS = {
+    "claude-sonnet-4.5": "claude-sonnet-4-20250514",
+    "claude-sonnet-4": "claude-sonnet-4-20250514",
+    "claude-haiku": "claude-3-5-haiku-20241022",
+    "claude-opus": "claude-opus-4-20250514",
+}
+
+OPENAI_MODELS = {
+    "gpt-4o": "gpt-4o",
+    "gpt-4o-mini": "gpt-4o-mini",
+    "gpt-4-turbo": "gpt-4-turbo",
+}
+
+# Provider by model family, the part of the model name before the first "-"
+MODEL_PROVIDERS = {
+    "claude": "anthropic",
+    "sonnet": "anthropic",
+    "haiku": "anthropic",
+    "opus": "anthropic",
+    "gpt": "openai",
+    "o1": "openai",
+}
+
+
+@functools.lru_cache(maxsize=64)
+def model_provider(model: str) -> str:
+    """
+    Get the provider serving a model.
+
+    Args:
+        model: Model name
+
+    Returns:
+        Provider name ("anthropic" or "openai")
+
+    Raises:
+        ValueError: If model not supported
+    """
+    name = model.lower()
+    provider = MODEL_PROVIDERS.get(name.split("-", 1)[0])
+    if provider is not None:
+        return provider
+
+    # Names that don't start with a family, e.g. "ft:gpt-4o-mini:org"
+    for family, provider in MODEL_PROVIDERS.items():
+        if family in name:
+            return provider
+    raise ValueError(f"Unknown model: {model}")
 
 
 class LLMService:
@@ -18,21 +78,81 @@ class LLMService:
     """
 
     def __init__(self):
-        self.anthropic_client: Optional[Anthropic] = None
-        self.openai_client: Optional[OpenAI] = None
+        settings = get_settings()
+        if not settings.has_anthropic and not settings.has_openai:
+            raise ValueError(
+                "No AI provider configured. Set ANTHROPIC_API_KEY or OPENAI_API_KEY in .env"
+            )
+
+        self.anthropic_client: Optional[AsyncAnthropic] = None
+        self.openai_client: Optional[AsyncOpenAI] = None
+        # (HTTP client, API base URL) per configured provider, for warm_up()
+        self._connections: list[tuple[Any, str]] = []
+        # Event loop the clients were created in; pooled connections and the
+        # semaphore can't be shared across loops, e.g. two asyncio.run() calls
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Closing clients left behind by a previous event loop
+        self._closing: set[asyncio.Task[None]] = set()
+
+        # Bounds requests in flight for every caller, not just the orchestrator
+        self.semaphore = asyncio.Semaphore(settings.llm_max_concurrent_requests)
+
+        self._streams = {"anthropic": self._stream_anthropic, "openai": self._stream_openai}
+
+    def _ensure_clients(self) -> None:
+        """Create the provider clients for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        # The previous loop's clients can't be reused; close their pools
+        # in the background instead of leaking the connections
+        if self._connections:
+            closing = loop.create_task(
+                close_http_clients([client for client, _ in self._connections])
+            )
+            self._closing.add(closing)
+            closing.add_done_callback(self._closing.discard)
+
+        settings = get_settings()
+        self._loop = loop
+        self.semaphore = asyncio.Semaphore(settings.llm_max_concurrent_requests)
+        self._connections = []
 
-        # Initialize clients based on available API keys
+        # Initialize clients based on available API keys, each with one
+        # shared HTTP/2 connection pool. The SDKs retry rate limits (429),
+        # timeouts and 5xx errors with exponential backoff and jitter.
         if settings.has_anthropic:
-            self.anthropic_client = Anthropic(api_key=settings.anthropic_api_key)
+            http_client = create_http_client(anthropic.DefaultAsyncHttpxClient)
+            self.anthropic_client = AsyncAnthropic(
+                api_key=settings.anthropic_api_key,
+                http_client=http_client,
+                max_retries=settings.llm_max_retries,
+            )
+            self._connections.append((http_client, str(self.anthropic_client.base_url)))
 
         if settings.has_openai:
-            self.openai_client = OpenAI(api_key=settings.openai_api_key)
-
-        if not self.anthropic_client and not self.openai_client:
-            raise ValueError(
-                "No AI provider configured. "
-                "Set ANTHROPIC_API_KEY or OPENAI_API_KEY in .env"
+            http_client = create_http_client(openai.DefaultAsyncHttpxClient)
+            self.openai_client = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                http_client=http_client,
+                max_retries=settings.llm_max_retries,
             )
+            self._connections.append((http_client, str(self.openai_client.base_url)))
+
+    async def warm_up(self) -> None:
+        """Open connections to the configured providers before the first call"""
+        self._ensure_clients()
+        await asyncio.gather(*(warm_http_client(c, url) for c, url in self._connections))
+
+    async def aclose(self) -> None:
+        """Close the provider clients; the next call creates new ones"""
+        connections = self._connections
+        self.anthropic_client = None
+        self.openai_client = None
+        self._connections = []
+        self._loop = None
+        await close_http_clients([client for client, _ in connections])
 
     async def call(
         self,
@@ -58,82 +178,132 @@ class LLMService:
         Raises:
             ValueError: If model not supported or no API key
         """
-        # Determine provider from model name
-        if "claude" in model.lower() or "sonnet" in model.lower() or "haiku" in model.lower():
-            return await self._call_anthropic(
-                system_prompt, user_prompt, model, temperature, max_tokens
-            )
-        elif "gpt" in model.lower():
-            return await self._call_openai(
-                system_prompt, user_prompt, model, temperature, max_tokens
-            )
-        else:
-            raise ValueError(f"Unknown model: {model}")
+        # Requests are always streamed: long generations don't hit the
+        # providers' idle timeouts, and there's only one request path
+        stream = self.call_stream(system_prompt, user_prompt, model, temperature, max_tokens)
+        return "".join([chunk async for chunk in stream])
 
-    async def _call_anthropic(
+    async def call_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model: str = "claude-sonnet-4.5",
+        temperature: float = 0.1,
+        max_tokens: int = 16000,
+    ) -> AsyncIterator[str]:
+        """
+        Call LLM with the given prompts, yielding text as it is generated.
+
+        Args:
+            system_prompt: System prompt (agent expertise)
+            user_prompt: User prompt (specific task)
+            model: Model to use
+            temperature: Sampling temperature (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Chunks of LLM response text
+
+        Raises:
+            ValueError: If model not supported or no API key
+        """
+        self._ensure_clients()
+        stream = self._streams[model_provider(model)](
+            system_prompt, user_prompt, model, temperature, max_tokens
+        )
+
+        # Hold a request slot until the stream is fully consumed (or closed)
+        async with self.semaphore:
+            async for chunk in stream:
+                yield chunk
+
+    async def _stream_anthropic(
         self,
         system_prompt: str,
         user_prompt: str,
         model: str,
         temperature: float,
         max_tokens: int,
-    ) -> str:
-        """Call Anthropic API"""
+    ) -> AsyncIterator[str]:
+        """Stream from Anthropic API"""
+        async with self._anthropic().messages.stream(
+            **self._anthropic_params(system_prompt, user_prompt, model, temperature, max_tokens)
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+
+    def _anthropic(self) -> AsyncAnthropic:
+        """Get the Anthropic client"""
         if not self.anthropic_client:
             raise ValueError("Anthropic API key not configured")
+        return self.anthropic_client
 
-        # Map friendly names to API model IDs
-        model_map = {
-            "claude-sonnet-4.5": "claude-sonnet-4-20250514",
-            "claude-sonnet-4": "claude-sonnet-4-20250514",
-            "claude-haiku": "claude-3-5-haiku-20241022",
-            "claude-opus": "claude-opus-4-20250514",
+    def _anthropic_params(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> dict[str, Any]:
+        """Build Anthropic Messages API parameters"""
+        return {
+            "model": ANTHROPIC_MODELS.get(model, model),
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            # Mark the system prompt as a cacheable prefix so repeated calls
+            # from the same agent reuse the provider-side prompt cache
+            "system": [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+            "messages": [{"role": "user", "content": user_prompt}],
         }
 
-        api_model = model_map.get(model, model)
-
-        response = self.anthropic_client.messages.create(
-            model=api_model,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            system=system_prompt,
-            messages=[{"role": "user", "content": user_prompt}],
-        )
-
-        return response.content[0].text
-
-    async def _call_openai(
+    async def _stream_openai(
         self,
         system_prompt: str,
         user_prompt: str,
         model: str,
         temperature: float,
         max_tokens: int,
-    ) -> str:
-        """Call OpenAI API"""
+    ) -> AsyncIterator[str]:
+        """Stream from OpenAI API"""
+        stream = await self._openai().chat.completions.create(
+            **self._openai_params(system_prompt, user_prompt, model, temperature, max_tokens),
+            stream=True,
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def _openai(self) -> AsyncOpenAI:
+        """Get the OpenAI client"""
         if not self.openai_client:
             raise ValueError("OpenAI API key not configured")
+        return self.openai_client
 
-        # Map friendly names to API model IDs
-        model_map = {
-            "gpt-4o": "gpt-4o",
-            "gpt-4o-mini": "gpt-4o-mini",
-            "gpt-4-turbo": "gpt-4-turbo",
-        }
-
-        api_model = model_map.get(model, model)
-
-        response = self.openai_client.chat.completions.create(
-            model=api_model,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            messages=[
+    def _openai_params(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> dict[str, Any]:
+        """Build OpenAI Chat Completions API parameters"""
+        return {
+            "model": OPENAI_MODELS.get(model, model),
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
-        )
-
-        return response.choices[0].message.content
+        }
 
 
 # Global LLM service instance
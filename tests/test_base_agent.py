@@ -0,0 +1,174 @@
+"""
+Tests for the base agent's LLM response cache and batched execution
+"""
+
+import dataclasses
+import os
+import time
+from collections import OrderedDict
+
+import pytest
+
+import agents.base as base
+from agents.base import (
+    LLM_BATCH_SIZE,
+    LLM_CACHE_MAX_TEMPERATURE,
+    AgentInput,
+    AgentOutput,
+    BaseAgent,
+    _store_llm_cache,
+    split_batch_response,
+)
+from orchestrator.core.config import get_settings_snapshot
+from orchestrator.core.models import AgentRole, FeatureRequest, WorkspaceContext
+
+
+@pytest.fixture
+def cache_settings(monkeypatch, tmp_path):
+    """Enable the LLM cache in a temporary directory, with an empty memory tier"""
+    settings = dataclasses.replace(
+        get_settings_snapshot(), enable_llm_cache=True, cache_dir=tmp_path, llm_cache_ttl_seconds=60
+    )
+    monkeypatch.setattr(base, "get_settings_snapshot", lambda: settings)
+    monkeypatch.setattr(base, "_llm_memory", OrderedDict())
+    return settings
+
+
+@pytest.fixture
+def agent():
+    """Create an agent whose responses are cacheable"""
+    return BaseAgent(role=AgentRole.CODE_REVIEWER, temperature=0.1)
+
+
+async def test_llm_cache_miss_then_hit(cache_settings, agent):
+    """Test that a stored response is returned for the same prompts"""
+    key = agent._prompt_key("system", "user")
+
+    path, cached = await agent._lookup_llm_cache(key)
+    assert cached is None
+    assert path is not None
+
+    await _store_llm_cache(key, path, "response")
+
+    assert await agent._lookup_llm_cache(key) == (path, "response")
+    assert agent._prompt_key("system", "other user") != key
+
+
+async def test_llm_cache_disk_tier(cache_settings, agent):
+    """Test that the disk tier answers when the memory tier doesn't have the key"""
+    key = agent._prompt_key("system", "user")
+    path, _ = await agent._lookup_llm_cache(key)
+    await _store_llm_cache(key, path, "response")
+
+    base._llm_memory.clear()
+
+    assert await agent._lookup_llm_cache(key) == (path, "response")
+    assert key in base._llm_memory
+
+
+async def test_llm_cache_expires(cache_settings, agent):
+    """Test that responses older than the TTL are misses in both tiers"""
+    key = agent._prompt_key("system", "user")
+    path, _ = await agent._lookup_llm_cache(key)
+    await _store_llm_cache(key, path, "response")
+
+    expired = time.time() - cache_settings.llm_cache_ttl_seconds - 1
+    base._llm_memory[key] = (expired, "response")
+    os.utime(path, (expired, expired))
+
+    assert await agent._lookup_llm_cache(key) == (path, None)
+
+
+async def test_llm_cache_skips_high_temperature(cache_settings):
+    """Test that agents sampling above the cache temperature are never cached"""
+    agent = BaseAgent(role=AgentRole.UX_RESEARCHER, temperature=LLM_CACHE_MAX_TEMPERATURE + 0.1)
+
+    assert await agent._lookup_llm_cache(agent._prompt_key("system", "user")) == (None, None)
+
+
+class _EchoAgent(BaseAgent):
+    """Agent whose output is its LLM response to the feature description"""
+
+    def __init__(self):
+        super().__init__(role=AgentRole.PRODUCT_MANAGER)
+
+    def get_system_prompt(self, workspace_context):
+        return "system"
+
+    def get_user_prompt(self, workspace_context, previous_deliverables):
+        return workspace_context.request.description
+
+    async def execute(self, input_data):
+        workspace = input_data.workspace_context
+        response = await self.call_llm(
+            self.get_system_prompt(workspace), self.get_user_prompt(workspace, [])
+        )
+        return AgentOutput.model_construct(metadata={"response": response})
+
+    async def execute_batch(self, inputs):
+        async with self.batched_llm(inputs):
+            return await super().execute_batch(inputs)
+
+
+def _input(description: str, tmp_path) -> AgentInput:
+    request = FeatureRequest(description=description)
+    workspace = WorkspaceContext(
+        feature_name="demo", workspace_path=tmp_path, project_path=tmp_path, request=request
+    )
+    return AgentInput.model_construct(
+        workspace_context=workspace, previous_deliverables=[], metadata={}
+    )
+
+
+@pytest.fixture
+def llm_calls(monkeypatch):
+    """Answer packed and single LLM calls without a provider, recording them"""
+    calls: list[list[str]] = []
+
+    async def call_llm_batch(self, system_prompt, user_prompts):
+        calls.append(user_prompts)
+        return [f"packed {prompt}" for prompt in user_prompts]
+
+    async def fetch_llm(self, key, system_prompt, user_prompt, max_tokens=None):
+        calls.append([user_prompt])
+        return f"single {user_prompt}"
+
+    monkeypatch.setattr(BaseAgent, "call_llm_batch", call_llm_batch)
+    monkeypatch.setattr(BaseAgent, "_fetch_llm", fetch_llm)
+    return calls
+
+
+async def test_execute_batch_packs_llm_requests(llm_calls, tmp_path):
+    """Test that requests sharing a system prompt are answered by packed calls"""
+    descriptions = [f"feature {i}" for i in range(LLM_BATCH_SIZE + 1)]
+
+    outputs = await _EchoAgent().execute_batch([_input(d, tmp_path) for d in descriptions])
+
+    assert [output.metadata["response"] for output in outputs] == [
+        *(f"packed {d}" for d in descriptions[:LLM_BATCH_SIZE]),
+        f"single {descriptions[-1]}",
+    ]
+    assert llm_calls == [descriptions[:LLM_BATCH_SIZE], descriptions[-1:]]
+    assert not base._prewarmed
+
+
+async def test_execute_batch_falls_back_to_single_calls(llm_calls, monkeypatch, tmp_path):
+    """Test that a packed response that can't be split isn't used"""
+
+    async def call_llm_batch(self, system_prompt, user_prompts):
+        return None
+
+    monkeypatch.setattr(BaseAgent, "call_llm_batch", call_llm_batch)
+
+    outputs = await _EchoAgent().execute_batch([_input("a", tmp_path), _input("b", tmp_path)])
+
+    assert [output.metadata["response"] for output in outputs] == ["single a", "single b"]
+
+
+def test_split_batch_response():
+    """Test that packed answers are split in order, and incomplete output is rejected"""
+    response = "===== RESPONSE 1 =====\nfirst\n===== RESPONSE 2 =====\nsecond\n===== END =====\n"
+
+    assert split_batch_response(response, 2) == ["first", "second"]
+    assert split_batch_response(response.replace("===== END =====\n", ""), 2) is None
+    assert split_batch_response(response, 3) is None
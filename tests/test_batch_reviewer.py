@@ -0,0 +1,97 @@
+"""
+Tests for the batch review agent
+"""
+
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+import agents.base as base
+from agents.base import AgentInput, BaseAgent
+from agents.review.batch_reviewer import BatchReviewAgent
+from orchestrator.core.models import AgentRole, FeatureRequest, WorkspaceContext
+
+RESPONSE = """### CODE_REVIEW
+Looks good.
+### PERFORMANCE_AUDIT
+No N+1 queries.
+### SECURITY_AUDIT
+No findings.
+### END
+"""
+
+
+@pytest.fixture
+def agent():
+    """Create a batch reviewer for all review agents"""
+    return BatchReviewAgent()
+
+
+def test_split_sections(agent):
+    """Test that each report is split out under its section name"""
+    assert agent._split_sections(RESPONSE) == {
+        "CODE_REVIEW": "Looks good.",
+        "PERFORMANCE_AUDIT": "No N+1 queries.",
+        "SECURITY_AUDIT": "No findings.",
+    }
+
+
+def test_split_sections_rejects_truncated_response(agent):
+    """Test that a response without the end heading isn't used"""
+    assert agent._split_sections(RESPONSE.replace("### END\n", "")) is None
+    assert agent._split_sections("") is None
+
+
+def test_split_sections_rejects_missing_section(agent):
+    """Test that a response missing a requested report isn't used"""
+    response = RESPONSE.replace("### PERFORMANCE_AUDIT\nNo N+1 queries.\n", "")
+
+    assert agent._split_sections(response) is None
+
+
+def test_split_sections_only_needs_requested_reports(agent):
+    """Test that a batch for some review agents only needs their reports"""
+    agent = BatchReviewAgent([AgentRole.CODE_REVIEWER, AgentRole.SECURITY_ENGINEER])
+    response = RESPONSE.replace("### PERFORMANCE_AUDIT\nNo N+1 queries.\n", "")
+
+    assert set(agent._split_sections(response)) == {"CODE_REVIEW", "SECURITY_AUDIT"}
+
+
+@pytest.mark.parametrize(
+    ("response", "cached"), [(RESPONSE, True), (RESPONSE.replace("### END\n", ""), False)]
+)
+async def test_only_complete_batch_responses_are_cached(
+    agent, monkeypatch, tmp_path, response, cached
+):
+    """Test that a truncated batched response isn't cached and replayed"""
+    stored: list[str] = []
+
+    async def lookup_llm_cache(self, key):
+        return str(tmp_path / key), None
+
+    async def store_llm_cache(key, path, response):
+        stored.append(response)
+
+    async def call(**kwargs):
+        return response
+
+    monkeypatch.setattr(BaseAgent, "_lookup_llm_cache", lookup_llm_cache)
+    monkeypatch.setattr(base, "_store_llm_cache", store_llm_cache)
+    monkeypatch.setitem(
+        sys.modules,
+        "orchestrator.services.llm_service",
+        SimpleNamespace(llm_service=SimpleNamespace(call=call)),
+    )
+    request = FeatureRequest(description="Demo feature")
+    input_data = AgentInput.model_construct(
+        workspace_context=WorkspaceContext(
+            feature_name="demo", workspace_path=tmp_path, project_path=tmp_path, request=request
+        ),
+        previous_deliverables=[],
+        metadata={},
+    )
+
+    await agent._answer(input_data, {}, {}, timeout=None)
+
+    assert stored == ([response] if cached else [])
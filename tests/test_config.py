@@ -0,0 +1,26 @@
+"""
+Tests for configuration
+"""
+
+import dataclasses
+
+from orchestrator.core.config import Settings, SettingsSnapshot, get_settings, get_settings_snapshot
+
+
+def test_settings_snapshot_mirrors_settings():
+    """Test that the snapshot declares exactly the settings fields"""
+    snapshot_fields = {field.name for field in dataclasses.fields(SettingsSnapshot)}
+
+    assert snapshot_fields == set(Settings.model_fields)
+
+
+def test_settings_snapshot_copies_values_and_checks():
+    """Test that the snapshot has the settings' values and configuration checks"""
+    settings = get_settings()
+    snapshot = get_settings_snapshot()
+
+    assert snapshot.agent_timeout_seconds == settings.agent_timeout_seconds
+    assert snapshot.workspace_dir == settings.workspace_dir
+    assert snapshot.has_openai == settings.has_openai
+    assert snapshot.has_anthropic == settings.has_anthropic
+    assert snapshot.has_github == settings.has_github
@@ -0,0 +1,66 @@
+"""
+Tests for the LLM service
+"""
+
+import asyncio
+import importlib.util
+
+import pytest
+
+from orchestrator.core.config import get_settings
+
+
+@pytest.fixture
+def llm_module(monkeypatch):
+    """Load the LLM service module with a provider configured, outside sys.modules"""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    get_settings.cache_clear()
+    spec = importlib.util.find_spec("orchestrator.services.llm_service")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    yield module
+    get_settings.cache_clear()
+
+
+@pytest.mark.parametrize(
+    ("model", "provider"),
+    [
+        ("claude-sonnet-4.5", "anthropic"),
+        ("Claude-Haiku", "anthropic"),
+        ("opus-4", "anthropic"),
+        ("gpt-4o-mini", "openai"),
+        ("o1-preview", "openai"),
+        ("ft:gpt-4o-mini:acme:custom:abc123", "openai"),
+    ],
+)
+def test_model_provider(llm_module, model, provider):
+    """Test that models are routed by family, including prefixed fine-tune names"""
+    assert llm_module.model_provider(model) == provider
+
+
+def test_model_provider_rejects_unknown_model(llm_module):
+    """Test that an unknown model is an error rather than a default provider"""
+    with pytest.raises(ValueError, match="Unknown model"):
+        llm_module.model_provider("llama-3-70b")
+
+
+def test_clients_are_replaced_and_closed_per_event_loop(llm_module):
+    """Test that a new event loop gets new clients and the old ones are closed"""
+    service = llm_module.LLMService()
+    clients = []
+
+    async def use_service():
+        service._ensure_clients()
+        clients.append(service.openai_client)
+        await asyncio.sleep(0)
+
+    asyncio.run(use_service())
+    asyncio.run(use_service())
+
+    assert clients[0] is not clients[1]
+    assert clients[0]._client.is_closed
+    assert not clients[1]._client.is_closed
+
+    asyncio.run(service.aclose())
+    assert clients[1]._client.is_closed
+    assert service.openai_client is None
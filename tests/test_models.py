@@ -0,0 +1,86 @@
+"""
+Tests for the workflow models
+"""
+
+from pathlib import Path
+
+import pytest
+
+from orchestrator.core.models import (
+    AgentRole,
+    AgentStatus,
+    AgentTask,
+    FeatureRequest,
+    SDLCPhase,
+    WorkflowExecution,
+    WorkflowMode,
+    WorkspaceContext,
+)
+
+
+def _task(role: AgentRole, status: AgentStatus = AgentStatus.PENDING) -> AgentTask:
+    return AgentTask(agent_role=role, phase=SDLCPhase.PRODUCT, description="", status=status)
+
+
+@pytest.fixture
+def execution():
+    """Create an empty workflow execution"""
+    request = FeatureRequest(description="Demo feature")
+    return WorkflowExecution(
+        id="test",
+        mode=WorkflowMode.FULL,
+        feature_request=request,
+        workspace_context=WorkspaceContext(
+            feature_name="demo",
+            workspace_path=Path("workspace/feature-demo"),
+            project_path=Path("."),
+            request=request,
+        ),
+    )
+
+
+def test_task_status_index_follows_status_changes(execution):
+    """Test that status queries reflect tasks added and moved between statuses"""
+    pm = _task(AgentRole.PRODUCT_MANAGER)
+    ba = _task(AgentRole.BUSINESS_ANALYST)
+    execution.add_task(pm)
+    execution.add_task(ba)
+
+    execution.set_task_status(pm, AgentStatus.RUNNING)
+    execution.set_task_status(pm, AgentStatus.COMPLETED)
+    execution.set_task_status(ba, AgentStatus.FAILED)
+
+    assert pm.status == AgentStatus.COMPLETED
+    assert execution.get_tasks_by_status(AgentStatus.COMPLETED) == [pm]
+    assert execution.get_tasks_by_status(AgentStatus.FAILED) == [ba]
+    assert execution.has_failed_tasks()
+    assert execution.count_tasks_by_status(AgentStatus.RUNNING) == 0
+    assert execution.count_tasks_by_status(AgentStatus.PENDING) == 0
+
+
+def test_task_status_index_covers_tasks_appended_directly(execution):
+    """Test that tasks appended to tasks directly show up in status queries"""
+    execution.add_task(_task(AgentRole.PRODUCT_MANAGER))
+    assert not execution.has_failed_tasks()
+
+    failed = _task(AgentRole.BUSINESS_ANALYST, AgentStatus.FAILED)
+    execution.tasks.append(failed)
+
+    assert execution.get_tasks_by_status(AgentStatus.FAILED) == [failed]
+    assert execution.has_failed_tasks()
+
+    execution.set_task_status(failed, AgentStatus.COMPLETED)
+    assert not execution.has_failed_tasks()
+
+
+def test_task_status_index_covers_initial_tasks(execution):
+    """Test that tasks passed to the constructor are indexed too"""
+    restored = WorkflowExecution(
+        **{**dict(execution), "tasks": [_task(AgentRole.PRODUCT_MANAGER, AgentStatus.COMPLETED)]}
+    )
+
+    assert restored.count_tasks_by_status(AgentStatus.COMPLETED) == 1
+
+    restored.set_task_status(restored.tasks[0], AgentStatus.FAILED)
+    assert restored.count_tasks_by_status(AgentStatus.FAILED) == 1
+    assert restored.count_tasks_by_status(AgentStatus.COMPLETED) == 0
@@ -2,11 +2,29 @@
 Tests for the core orchestrator
 """
 
+import dataclasses
+
 import pytest
 from pathlib import Path
 
-from orchestrator.core.models import FeatureRequest, WorkflowMode
-from orchestrator.core.orchestrator import SDLCOrchestrator
+import agents.base as base
+from agents.base import cancel_prewarmed
+from orchestrator.core.models import (
+    AgentRole,
+    FeatureRequest,
+    WorkflowExecution,
+    WorkflowMode,
+    WorkspaceContext,
+)
+from orchestrator.core.orchestrator import (
+    AGENT_DEPENDENCIES,
+    RETRY_BACKOFF_BASE_SECONDS,
+    RETRY_BACKOFF_MAX_SECONDS,
+    WORKFLOW_PHASES,
+    SDLCOrchestrator,
+    _retry_delay,
+    dependency_levels,
+)
 
 
 @pytest.fixture
@@ -67,3 +85,81 @@ def test_generate_feature_name(orchestrator):
     assert "team-activity-log" in feature_name
     assert "!" not in feature_name  # Special chars removed
     assert " " not in feature_name  # Spaces replaced with dashes
+
+
+def _wave_of(levels: list[list[AgentRole]]) -> dict[AgentRole, int]:
+    return {role: i for i, level in enumerate(levels) for role in level}
+
+
+def test_dependency_levels_run_dependencies_first(orchestrator):
+    """Test that every agent of the full workflow runs after its dependencies"""
+    roles = orchestrator._workflow_agents(WORKFLOW_PHASES)
+    wave = _wave_of(dependency_levels(roles))
+
+    assert sorted(wave, key=roles.index) == roles
+    assert dependency_levels(roles)[0] == [AgentRole.PRODUCT_MANAGER]
+    for role in roles:
+        for dep in AGENT_DEPENDENCIES.get(role, ()):
+            assert wave[dep] < wave[role], f"{role.value} must run after {dep.value}"
+
+    # Agents from later phases start as soon as their dependencies are done
+    assert wave[AgentRole.TECHNICAL_WRITER] < wave[AgentRole.BACKEND_ENGINEER]
+
+
+def test_dependency_levels_inherit_dependencies_of_disabled_agents(orchestrator):
+    """Test that disabling an agent in a chain keeps its dependents ordered"""
+    roles = orchestrator._workflow_agents(WORKFLOW_PHASES)
+    roles.remove(AgentRole.SECURITY_ARCHITECT)
+    wave = _wave_of(dependency_levels(roles))
+
+    assert AgentRole.SECURITY_ARCHITECT not in wave
+    assert wave[AgentRole.SOLUTIONS_ARCHITECT] < wave[AgentRole.DATABASE_ENGINEER]
+
+
+def test_dependency_levels_reject_cycles(monkeypatch):
+    """Test that a dependency cycle is reported instead of dropping agents"""
+    monkeypatch.setitem(AGENT_DEPENDENCIES, AgentRole.PRODUCT_MANAGER, (AgentRole.UX_RESEARCHER,))
+
+    with pytest.raises(ValueError, match="cycle"):
+        dependency_levels([AgentRole.PRODUCT_MANAGER, AgentRole.UX_RESEARCHER])
+
+
+@pytest.mark.parametrize("retry", [1, 2, 3, 10, 100])
+def test_retry_delay_is_bounded(retry):
+    """Test that retry delays back off exponentially up to the cap, plus jitter"""
+    backoff = min(RETRY_BACKOFF_MAX_SECONDS, RETRY_BACKOFF_BASE_SECONDS * 2 ** (retry - 1))
+
+    for _ in range(20):
+        delay = _retry_delay(retry)
+        assert backoff <= delay <= backoff + RETRY_BACKOFF_BASE_SECONDS
+
+
+async def test_prewarm_skips_batched_reviews(orchestrator, sample_request, tmp_path):
+    """Test that reviews answered by the batched call aren't also prewarmed"""
+    orchestrator.settings = dataclasses.replace(
+        orchestrator.settings, enable_speculative_prewarm=True, enable_review_batching=True
+    )
+    execution = WorkflowExecution(
+        id="test",
+        mode=WorkflowMode.FULL,
+        feature_request=sample_request,
+        workspace_context=WorkspaceContext(
+            feature_name="demo",
+            workspace_path=tmp_path,
+            project_path=tmp_path,
+            request=sample_request,
+        ),
+    )
+    wave = [
+        AgentRole.SECURITY_ENGINEER,
+        AgentRole.CODE_REVIEWER,
+        AgentRole.PERFORMANCE_ENGINEER,
+        AgentRole.DEVOPS_ENGINEER,
+    ]
+
+    prewarmed = orchestrator._prewarm_agents(execution, wave)
+    try:
+        assert len(prewarmed) == 1
+        assert list(base._prewarmed.values()) == prewarmed
+    finally:
+        cancel_prewarmed(prewarmed)
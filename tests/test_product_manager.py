@@ -0,0 +1,30 @@
+"""
+Tests for the Product Manager agent
+"""
+
+import pytest
+
+from agents.product.product_manager import find_prd_sections
+
+
+@pytest.mark.parametrize(
+    "heading",
+    [
+        "## User Stories",
+        "## User stories",
+        "### User Stories",
+        "  ## User Stories",
+        "**## User Stories**",
+    ],
+)
+def test_find_prd_sections_accepts_user_stories_headings(heading):
+    """Test that user stories headings pass at any level, indent, or emphasis"""
+    prd = f"# PRD: Demo\n\n{heading}\n\n**Acceptance Criteria:**\n- Works\n"
+
+    assert find_prd_sections(prd) == {"us", "ac"}
+
+
+def test_find_prd_sections_reports_missing_sections():
+    """Test that only the sections present are reported"""
+    assert find_prd_sections("# PRD\n\nUser stories are below.\n") == set()
+    assert find_prd_sections("# PRD\n\nacceptance criteria: TBD\n") == {"ac"}
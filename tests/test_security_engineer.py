@@ -0,0 +1,66 @@
+"""
+Tests for the Security Engineer agent
+"""
+
+from agents.review.security_engineer import BLOCKING_SEVERITIES, count_severities
+
+
+def _blocking(audit: str) -> bool:
+    counts = count_severities(audit)
+    return any(counts[severity] for severity in BLOCKING_SEVERITIES)
+
+
+def test_zero_count_summary_is_not_a_finding():
+    """Test that a summary table of zero counts passes the gate"""
+    audit = "## Summary\nCritical: 0\nHigh: 0\n**Medium:** 0\nLow: 1\n"
+
+    assert count_severities(audit) == {"critical": 0, "high": 0, "medium": 0, "low": 1, "info": 0}
+    assert not _blocking(audit)
+
+
+def test_ratings_count_as_findings():
+    """Test that uppercase ratings, labels, and severity fields are counted"""
+    audit = (
+        "1. SQL injection in search - CRITICAL\n"
+        "2. Critical: secrets in client bundle\n"
+        "3. Missing rate limit\n   Severity: high\n"
+        "4. Verbose errors (low)\n"
+    )
+
+    counts = count_severities(audit)
+
+    assert counts["critical"] == 2
+    assert counts["high"] == 1
+    assert counts["low"] == 0  # lowercase prose isn't a rating
+    assert _blocking(audit)
+
+
+def test_summary_counts_are_not_added_to_listed_findings():
+    """Test that a summary and the findings it sums up aren't double counted"""
+    audit = "High: 2\n\n- Open redirect (Severity: High)\n- IDOR (Severity: High)\n"
+
+    assert count_severities(audit)["high"] == 2
+
+
+def test_zero_summary_does_not_hide_listed_findings():
+    """Test that a finding still blocks when the summary says zero"""
+    assert _blocking("Critical: 0\n\n- RLS bypass on teams table - CRITICAL\n")
+
+
+def test_empty_summary_values_are_not_findings():
+    """Test that "None", "N/A" and "-" after a label count as zero"""
+    audit = "## Summary\nCritical: None\nHigh: N/A\nMedium: -\nLow: 1\n"
+
+    assert count_severities(audit) == {"critical": 0, "high": 0, "medium": 0, "low": 1, "info": 0}
+    assert not _blocking(audit)
+
+
+def test_uppercase_prose_is_not_a_rating():
+    """Test that uppercase severities only count where a rating goes"""
+    assert not _blocking("No HIGH risk items were identified.\nCRITICAL paths were reviewed.\n")
+
+    audit = "| Finding | Severity |\n|---|---|\n| IDOR | **HIGH** |\n\n### CRITICAL: RLS bypass\n"
+    counts = count_severities(audit)
+
+    assert counts["high"] == 1
+    assert counts["critical"] == 1